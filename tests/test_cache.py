@@ -0,0 +1,73 @@
+import uuid
+from unittest import TestCase
+
+import pytest
+
+from theflow.cache import MemoryCache
+
+
+class TestMemoryCache(TestCase):
+    def setUp(self):
+        # each test has its own store
+        self.cache = MemoryCache(uid=uuid.uuid4().hex)
+
+    def test_get_set(self):
+        self.assertIsNone(self.cache.get("missing"))
+        self.assertEqual(self.cache.get("missing", default=1), 1)
+
+        self.cache.set("key", "value")
+        self.assertEqual(self.cache.get("key", default=1), "value")
+        self.assertEqual(self.cache["key"], "value")
+        self.assertIn("key", self.cache)
+        self.assertNotIn("missing", self.cache)
+        with pytest.raises(KeyError):
+            self.cache["missing"]
+
+    def test_add_only_sets_missing_key(self):
+        self.cache.add("key", 1)
+        self.assertEqual(self.cache.get("key"), 1)
+        self.cache.add("key", 2)
+        self.assertEqual(self.cache.get("key"), 1)
+
+    def test_delete(self):
+        self.cache.set("key", 1)
+        self.cache.delete("key")
+        self.assertNotIn("key", self.cache)
+        self.cache.delete("missing")  # doesn't raise
+
+        self.cache["key"] = 1
+        del self.cache["key"]
+        self.assertNotIn("key", self.cache)
+        with pytest.raises(KeyError):
+            del self.cache["missing"]
+
+    def test_incr_decr(self):
+        self.assertEqual(self.cache.incr("counter"), 1)
+        self.assertEqual(self.cache.incr("counter", delta=5), 6)
+        self.assertEqual(self.cache.decr("counter", delta=2), 4)
+        self.assertEqual(self.cache.decr("other"), -1)
+        self.assertEqual(self.cache.get("counter"), 4)
+
+    def test_get_then_set(self):
+        value = self.cache.get_then_set("key", lambda v: v + [1], default=[])
+        self.assertEqual(value, [1])
+        self.assertEqual(self.cache.get("key"), [1])
+
+        value = self.cache.get_then_set("key", lambda v: v + [2], default=[])
+        self.assertEqual(value, [1, 2])
+        self.assertEqual(self.cache.get("key"), [1, 2])
+
+    def test_get_then_set_error_doesnt_set(self):
+        def fail(_):
+            raise ValueError("fail")
+
+        with pytest.raises(ValueError):
+            self.cache.get_then_set("key", fail)
+        self.assertNotIn("key", self.cache)
+
+    def test_clear(self):
+        self.cache.set("a", 1)
+        self.cache.set("b", 2)
+        self.cache.clear()
+        self.assertNotIn("a", self.cache)
+        self.assertNotIn("b", self.cache)
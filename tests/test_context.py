@@ -80,3 +80,21 @@ class TestContext(TestCase):
         self.assertEqual(retrieved_context["b"], 2)
         self.assertEqual(retrieved_context["c"], 3)
         self.assertTrue(isinstance(retrieved_context["d"], X))
+
+    def test_update(self):
+        """Test setting multiple values at once keeps the existing values"""
+        context = Context()
+        name = context.create_context("test_update", exist_ok=True)
+        context.set("a", 1, context=name)
+        context.update({"b": 2, "c": 3}, context=name)
+
+        self.assertEqual(context.get(None, context=name), {"a": 1, "b": 2, "c": 3})
+
+    def test_missing_context(self):
+        """Test accessing a context that doesn't exist raises error"""
+        context = Context()
+        with self.assertRaises(ValueError):
+            context.get("a", context="test_missing_context")
+        with self.assertRaises(ValueError):
+            context.set("a", 1, context="test_missing_context")
+        self.assertFalse(context.has_context("test_missing_context"))
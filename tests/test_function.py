@@ -1,12 +1,16 @@
+import threading
 from copy import deepcopy
+from typing import Optional
 from unittest import TestCase
 
 import pytest
 
 from theflow import Function, Node, Param, load
+from theflow.base import ProxyFunction, unset
 from theflow.config import DefaultConfig
 from theflow.debug import likely_cyclic_pipeline
 from theflow.exceptions import CyclicPipelineError
+from theflow.utils.modules import lazy
 
 from .assets.sample_flow import Func, Multiply, Sum1, Sum2, callback
 
@@ -220,6 +224,239 @@ class TestParam(TestCase):
         )
 
 
+class MissingChild(Function):
+    a: int
+    b: int = 1
+
+    def run(self):
+        return self.a + self.b
+
+
+class MissingParent(Function):
+    x: int
+    child: Function
+    other: Function
+
+    def run(self):
+        return self.x
+
+
+class TestMissing(TestCase):
+    def test_missing_params_and_nodes(self):
+        """Unset params and nodes are reported, including those of the children"""
+        parent = MissingParent(child=MissingChild())
+        self.assertEqual(
+            parent.missing(), {"params": ["x", "child.a"], "nodes": ["other"]}
+        )
+
+        parent.x = 1
+        parent.child.a = 1
+        parent.other = MissingChild(a=1)
+        self.assertEqual(parent.missing(), {"params": [], "nodes": []})
+
+    def test_missing_shared_child(self):
+        """A child used by several nodes isn't mistaken for a cycle"""
+        child = MissingChild()
+        parent = MissingParent(x=1, child=child, other=child)
+        self.assertEqual(
+            parent.missing(), {"params": ["child.a", "other.a"], "nodes": []}
+        )
+
+
+class Compatible(Function):
+    x: int = 1
+    y: Optional[str] = None
+
+    def run(self):
+        return self.x
+
+
+class TestIsCompatible(TestCase):
+    def test_param_is_compatible(self):
+        func = Compatible()
+        self.assertTrue(func.is_compatible("x", 2))
+        self.assertFalse(func.is_compatible("x", "2"))
+        self.assertTrue(func.is_compatible("y", "2"))
+        self.assertTrue(func.is_compatible("y", None))
+        self.assertFalse(func.is_compatible("y", 2))
+
+    def test_nested_path_is_compatible(self):
+        func = WithTypedNode()
+        self.assertTrue(func.is_compatible("compatible.x", 2))
+        self.assertFalse(func.is_compatible("compatible.x", "2"))
+        self.assertFalse(func.is_compatible("compatible", Compatible))
+
+        class TakeX(Function):
+            def run(self, x: int):
+                return x
+
+        self.assertTrue(func.is_compatible("compatible", TakeX))
+
+
+class WithTypedNode(Function):
+    compatible: Compatible = Node(default=Compatible, input={"x": int})
+
+    def run(self):
+        return self.compatible()
+
+
+class TestSpecs(TestCase):
+    def test_specs_are_copied(self):
+        """Modifying the returned specs doesn't affect the declaration"""
+        func = WithTypedNode()
+        specs = func.specs("compatible")
+        specs["input"]["y"] = str
+        specs["help"] = "changed"
+
+        specs = func.specs("compatible")
+        self.assertEqual(specs["input"], {"x": int})
+        self.assertEqual(specs["help"], "")
+        self.assertIs(specs["output"], unset)
+
+    def test_specs_keep_uncopyable_default(self):
+        lock = threading.Lock()
+
+        class WithClient(Function):
+            client: object = lock
+
+            def run(self):
+                ...
+
+        self.assertIs(WithClient().specs("client")["default"], lock)
+
+
+class SlottedMixin:
+    __slots__ = ("slotted",)
+
+
+class NoParam(Function):
+    def run(self):
+        return 1
+
+
+class OneParam(Function):
+    x: int = 1
+
+    def run(self):
+        return self.x
+
+
+class TestParams(TestCase):
+    def test_params_and_repr(self):
+        """All params are read at once, for any number of params"""
+        self.assertEqual(NoParam().params, {})
+        self.assertEqual(repr(NoParam()), "NoParam()")
+        self.assertEqual(OneParam(x=2).params, {"x": 2})
+        self.assertEqual(repr(OneParam(x=2)), "OneParam(x=2)")
+        self.assertEqual(Multiply(a=2).params, {"a": 2})
+
+
+class TestSubclass(TestCase):
+    def test_subclass_with_slotted_base(self):
+        """Function can be combined with a class that declares __slots__"""
+
+        class SlottedFunction(SlottedMixin, Function):
+            x: int = 1
+
+            def run(self):
+                return self.x
+
+        func = SlottedFunction(x=2)
+        self.assertEqual(func.x, 2)
+        self.assertEqual(func(), 2)
+
+    def test_internal_state_is_slotted(self):
+        """Internal state is kept in slots, out of the instance dict"""
+        func = OneParam()
+        func()
+        self.assertFalse(hasattr(func._ff_state, "__dict__"))
+        self.assertNotIn("_ff_childs_called", func.__dict__)
+        self.assertNotIn("_middleware", func.__dict__)
+
+        # each instance has its own state
+        func.set_run({"x": 3})
+        self.assertIsNone(OneParam()._ff_state.run_kwargs)
+
+
+class TestProxyFunction(TestCase):
+    def test_run_forwards_to_original_object(self):
+        class WithRun:
+            def run(self, x):
+                return x * 2
+
+        self.assertEqual(ProxyFunction(ff_original_obj=WithRun()).run(3), 6)
+
+    def test_run_without_original_run_raise_error(self):
+        with pytest.raises(NotImplementedError):
+            ProxyFunction(ff_original_obj=object()).run(3)
+
+    def test_swap_original_obj(self):
+        """Methods are dispatched to the current original object"""
+
+        class Greeter:
+            def __init__(self, name):
+                self.name = name
+
+            def hello(self, x):
+                return f"{self.name} {x}"
+
+        class UntrackedProxy(ProxyFunction):
+            class Config:
+                middleware_switches = {
+                    "theflow.middleware.TrackProgressMiddleware": False,
+                    "theflow.middleware.SkipComponentMiddleware": False,
+                }
+
+        proxy = UntrackedProxy(ff_original_obj=Greeter("A"))
+        self.assertEqual(proxy.hello(1), "A 1")
+        self.assertIn("hello", proxy.__dict__, "Method is exposed on the instance")
+        self.assertEqual(proxy.hello(2), "A 2")
+
+        proxy.ff_original_obj = Greeter("B")
+        self.assertNotIn("hello", proxy.__dict__, "Exposed method is dropped")
+        self.assertEqual(proxy.hello(1), "B 1")
+        self.assertEqual(proxy.hello(2), "B 2")
+
+    def test_initialize_drops_wrapped_callables(self):
+        class WithHello:
+            def hello(self, x):
+                return x
+
+        proxy = ProxyFunction(ff_original_obj=WithHello())
+        wrapped = proxy.hello
+        self.assertIs(proxy.hello, wrapped, "Wrapped callable is reused")
+
+        proxy._initialize()
+        self.assertIsNot(proxy.hello, wrapped, "Wrapped callable is rebuilt")
+
+    def test_wrapped_callables_are_kept_in_slotted_state(self):
+        class WithHello:
+            def hello(self, x):
+                return x
+
+        proxy = ProxyFunction(ff_original_obj=WithHello())
+        wrapped = proxy.hello
+        self.assertIs(proxy._ff_state.callables["hello"][1], wrapped)
+        self.assertFalse(hasattr(proxy._ff_state, "__dict__"))
+        self.assertNotIn("_ff_proxy_callables", proxy.__dict__)
+
+
+class NoStoreResult(Function):
+    class Config:
+        store_result = None
+
+    def run(self, x):
+        return x + 1
+
+
+class TestStoreResult(TestCase):
+    def test_run_without_store_result(self):
+        """The run is still tracked in the context when store_result is not set"""
+        func = NoStoreResult()
+        self.assertEqual(func(1), 2)
+        self.assertEqual(func.last_run.logs(".")["output"]["value"], 2)
+
+
 class A(Function):
     x: int = 1
     y1: Function
@@ -267,6 +504,27 @@ class B2(Function):
         return self.x
 
 
+_loop_default = lazy(B2)
+
+
+class Loop(Function):
+    child: Function = Node(default=_loop_default)
+
+    def run(self):
+        return self.child()
+
+
+_loop_default._cls = Loop
+
+
+class Diamond(Function):
+    left: Function = Node(default=B2)
+    right: Function = Node(default=B2)
+
+    def run(self):
+        return self.left() + self.right()
+
+
 class TestCircularDependency:
     """Check for analyzing circular dependency"""
 
@@ -292,6 +550,15 @@ class TestCircularDependency:
         with pytest.raises(RecursionError):
             a.dump()
 
+    def test_describe_cyclic_default_raise_error(self):
+        with pytest.raises(CyclicPipelineError):
+            Loop.describe()
+
+    def test_describe_shared_default(self):
+        """A class used by several nodes isn't mistaken for a cycle"""
+        nodes = Diamond.describe()["nodes"]
+        assert nodes["left"]["default"]["type"] == nodes["right"]["default"]["type"]
+
     def test_initiating_circular_dependency_doesnt_raise_error(self):
         assert isinstance(A1(), A1)
 
@@ -322,3 +589,26 @@ class TestCircularDependency:
         assert not likely_cyclic_pipeline(a)[0]
         assert not likely_cyclic_pipeline(b)[0]
         assert not likely_cyclic_pipeline(c)[0]
+
+    def test_apply_circular_dependency(self):
+        """Apply visits each node of a cyclic pipeline once, children first"""
+        a = A()
+        b = B()
+        c = C()
+        a.y1 = b
+        b.y2 = c
+        c.y3 = a
+        visited = []
+        a.apply(lambda func: visited.append(func))
+        assert visited == [c, b, a]
+
+    def test_missing_circular_dependency_raise_error(self):
+        """Missing raises error instead of recursing forever on cyclic pipeline"""
+        a = A()
+        b = B()
+        c = C()
+        a.y1 = b
+        b.y2 = c
+        c.y3 = a
+        with pytest.raises(CyclicPipelineError):
+            a.missing()
@@ -3,6 +3,7 @@ import time
 from concurrent.futures import ThreadPoolExecutor
 
 from theflow import Function
+from theflow.base import ConcurrentFunction
 
 
 class FunctionA(Function):
@@ -35,3 +36,62 @@ def test_multithreading():
 
     seconds = [each[1] for each in result]
     assert len(set(seconds)) == 2, "Should have 2 different threads"
+
+
+class FunctionC(Function):
+    offset: int = 0
+
+    def run(self, idx: int) -> tuple[int, int]:
+        time.sleep(0.05)
+        return (idx + self.offset, threading.get_ident())
+
+
+def test_concurrent_function_threads():
+    func = ConcurrentFunction(funcs=[FunctionC(offset=i) for i in range(4)])
+    result = func(10)
+    assert [each[0] for each in result] == [10, 11, 12, 13]
+    assert len({each[1] for each in result}) == 4, "Each child runs in a thread"
+
+    steps = func.last_run.steps()
+    for idx in range(4):
+        assert f".func{idx}_FunctionC" in steps
+
+
+def test_concurrent_function_no_threads():
+    func = ConcurrentFunction(
+        funcs=[FunctionC(offset=i) for i in range(3)], use_threads=False
+    )
+    result = func(1)
+    assert [each[0] for each in result] == [1, 2, 3]
+    assert {each[1] for each in result} == {threading.get_ident()}
+
+    steps = func.last_run.steps()
+    for idx in range(3):
+        assert f".func{idx}_FunctionC" in steps
+
+
+class FunctionD(Function):
+    func: FunctionA = FunctionA.withx()
+
+    def run(self):
+        runstates = self.fl.runstates()
+
+        def exec(idx):
+            self.fl.track(**runstates)
+            try:
+                return self.func(idx)
+            finally:
+                self.fl.clear()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            return list(executor.map(exec, range(10)))
+
+
+def test_multithreading_child_states():
+    func = FunctionD()
+    result = func()
+    assert [each[0] for each in result] == list(range(10))
+    steps = func.last_run.steps()
+    names = [".func"] + [f".func[{i}]" for i in range(1, 10)]
+    for name in names:
+        assert name in steps, f"Child call {name} is recorded"
@@ -1,9 +1,11 @@
+import uuid
 from unittest import TestCase
 from unittest.mock import patch
 
 import pytest
 
 from theflow import Function, Node
+from theflow.middleware import CachingMiddleware
 
 from .assets.sample_flow import Func, Sum1
 
@@ -54,6 +56,112 @@ class CachingMiddlewareTest(TestCase):
         run.assert_called_once()  # the last time isn't called, still called once
 
 
+class Memo2(Function):
+    class Config:
+        memo_size = 2
+
+    def run(self, x):
+        ...
+
+
+class NoMemo(Function):
+    class Config:
+        memo_size = 0
+
+    def run(self, x):
+        ...
+
+
+class CachingMiddlewareMemoTest(TestCase):
+    def make_middleware(self, cls):
+        """Middleware whose next call returns a new list for each input"""
+        calls = []
+
+        def next_call(x):
+            calls.append(x)
+            return [x]
+
+        return CachingMiddleware(obj=cls(), next_call=next_call), calls
+
+    def test_hit_returns_copy(self):
+        middleware, calls = self.make_middleware(Memo2)
+        key = uuid.uuid4().hex
+        output = middleware(key)
+        output.append("modified by caller")
+
+        hit1 = middleware(key)
+        self.assertEqual(hit1, [key])
+        hit1.append("modified by caller")
+        self.assertEqual(middleware(key), [key])
+        self.assertEqual(calls, [key])
+        self.assertEqual(len(middleware._memo), 1)
+
+    def test_lru_eviction(self):
+        middleware, calls = self.make_middleware(Memo2)
+        keys = [uuid.uuid4().hex for _ in range(3)]
+        middleware(keys[0])
+        middleware(keys[1])
+        middleware(keys[0])  # keys[0] becomes the most recently used
+        middleware(keys[2])  # evicts keys[1]
+
+        memoized = set(middleware._memo)
+        self.assertEqual(len(memoized), 2)
+        self.assertIn(middleware.create_key(keys[0]), memoized)
+        self.assertIn(middleware.create_key(keys[2]), memoized)
+        self.assertNotIn(middleware.create_key(keys[1]), memoized)
+
+        # evicted outputs are still served by the backing cache
+        self.assertEqual(middleware(keys[1]), [keys[1]])
+        self.assertEqual(calls, keys)
+
+    def test_memo_size_zero_disables_memo(self):
+        middleware, calls = self.make_middleware(NoMemo)
+        key = uuid.uuid4().hex
+        middleware(key)
+        self.assertEqual(middleware(key), [key])
+        self.assertEqual(len(middleware._memo), 0)
+        self.assertEqual(calls, [key])
+
+    def test_hit_skips_backing_cache(self):
+        """A memo hit is served without a round-trip to the backing cache"""
+        middleware, calls = self.make_middleware(Memo2)
+        middleware._cache = cache = CountingCache(middleware._cache)
+        key = uuid.uuid4().hex
+        middleware(key)
+        accesses = cache.accesses
+
+        for _ in range(3):
+            self.assertEqual(middleware(key), [key])
+        self.assertEqual(cache.accesses, accesses)
+        self.assertEqual(calls, [key])
+
+        no_memo, _ = self.make_middleware(NoMemo)
+        no_memo._cache = cache = CountingCache(no_memo._cache)
+        no_memo(key)
+        accesses = cache.accesses
+        no_memo(key)
+        self.assertGreater(cache.accesses, accesses)
+
+
+class CountingCache:
+    """Count the lookups to the wrapped cache"""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.accesses = 0
+
+    def __contains__(self, key):
+        self.accesses += 1
+        return key in self.cache
+
+    def __getitem__(self, key):
+        self.accesses += 1
+        return self.cache[key]
+
+    def __setitem__(self, key, value):
+        self.cache[key] = value
+
+
 class A1(Function):
     x: int = 1
     y: Function = Node(default_callback=lambda _: A2(x=1))
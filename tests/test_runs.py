@@ -0,0 +1,151 @@
+import pickle
+import shutil
+import tempfile
+from enum import Enum, IntEnum
+from pathlib import Path
+from unittest import TestCase
+
+from theflow.base import Function
+from theflow.runs.base import (
+    RunStructure,
+    RunTracker,
+    is_json_native,
+    merge_progress,
+    split_progress,
+)
+
+
+class Color(str, Enum):
+    RED = "red"
+
+
+class Level(IntEnum):
+    LOW = 1
+
+
+class Point:
+    def __init__(self, x):
+        self.x = x
+
+    def __eq__(self, other):
+        return isinstance(other, Point) and other.x == self.x
+
+
+class TestJsonNative(TestCase):
+    def test_native_values(self):
+        self.assertTrue(is_json_native(None))
+        self.assertTrue(is_json_native("a"))
+        self.assertTrue(is_json_native(True))
+        self.assertTrue(is_json_native(1))
+        self.assertTrue(is_json_native(1.5))
+        self.assertTrue(is_json_native({"a": [1, {"b": None}]}))
+
+    def test_non_native_values(self):
+        self.assertFalse(is_json_native(float("nan")))
+        self.assertFalse(is_json_native((1, 2)))
+        self.assertFalse(is_json_native({1: "a"}))
+        self.assertFalse(is_json_native([1, Point(1)]))
+
+    def test_big_integers(self):
+        self.assertTrue(is_json_native(2**64 - 1))
+        self.assertTrue(is_json_native(-(2**63)))
+        self.assertFalse(is_json_native(2**70))
+        self.assertFalse(is_json_native({"a": [-(2**70)]}))
+
+    def test_subclasses_of_native_types(self):
+        self.assertFalse(is_json_native(Color.RED))
+        self.assertFalse(is_json_native(Level.LOW))
+        self.assertFalse(is_json_native({"a": [Level.LOW]}))
+        self.assertFalse(is_json_native({Color.RED: 1}))
+
+
+class TestSplitProgress(TestCase):
+    def test_round_trip(self):
+        progress = {
+            "name": "flow",
+            "empty": {},
+            ".": {
+                "input": {"args": (1, 2), "kwargs": {"x": {"nested": [1, 2]}}},
+                "output": {"a": {"b": 1}},
+                "status": "run",
+            },
+            ".step": {"output": Point(1), "color": Color.RED, "level": Level.LOW},
+            "point": Point(2),
+        }
+        native, rest = split_progress(progress)
+        self.assertEqual(native["."]["status"], "run")
+        self.assertEqual(native["."]["output"], {"a": {"b": 1}})
+        self.assertIn("input", rest["."])
+        self.assertEqual(set(rest[".step"]), {"output", "color", "level"})
+
+        merged = merge_progress(native, pickle.loads(pickle.dumps(rest)))
+        self.assertEqual(merged, progress)
+        self.assertIs(type(merged[".step"]["color"]), Color)
+        self.assertIs(type(merged[".step"]["level"]), Level)
+
+
+class Producer(Function):
+    class Config:
+        middleware_switches = {"theflow.middleware.CachingMiddleware": False}
+
+    def run(self, x):
+        return {"color": Color.RED, "level": Level.LOW, "point": Point(x), "x": x}
+
+
+class TestPersistAndLoad(TestCase):
+    def setUp(self):
+        self.store = tempfile.mkdtemp(prefix="theflow_runs_")
+
+    def tearDown(self):
+        shutil.rmtree(self.store, ignore_errors=True)
+
+    def _load(self, func, run_path):
+        tracker = RunTracker(func, "__from_run__")
+        tracker.load(run_path)
+        return tracker
+
+    def test_persist_and_load(self):
+        class StoredProducer(Producer):
+            class Config:
+                store_result = self.store
+
+        func = StoredProducer()
+        output = func(2)
+        run_path = Path(self.store, func.last_run.id())
+        self.assertTrue((run_path / RunStructure.progress_json).exists())
+
+        loaded = self._load(func, run_path)
+        self.assertEqual(loaded.logs(), func.last_run.logs())
+        loaded_output = loaded.output()["value"]
+        self.assertEqual(loaded_output, output)
+        self.assertIs(type(loaded_output["color"]), Color)
+        self.assertIs(type(loaded_output["level"]), Level)
+
+    def test_persist_big_integer(self):
+        class BigProducer(Producer):
+            class Config:
+                store_result = self.store
+
+            def run(self, x):
+                return {"big": 2**70 + x, "x": x}
+
+        func = BigProducer()
+        output = func(1)
+        run_path = Path(self.store, func.last_run.id())
+
+        loaded = self._load(func, run_path)
+        self.assertEqual(loaded.output()["value"], output)
+
+    def test_load_old_format(self):
+        """Runs persisted before progress.json existed only have progress.pkl"""
+        func = Producer()
+        func(3)
+        progress = func.last_run.logs()
+
+        run_path = Path(self.store, "old_run")
+        run_path.mkdir()
+        with (run_path / RunStructure.progress).open("wb") as fo:
+            pickle.dump(progress, fo)
+
+        loaded = self._load(func, run_path)
+        self.assertEqual(loaded.logs(), progress)
@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 from unittest import TestCase
@@ -5,6 +6,7 @@ from unittest import TestCase
 import pytest
 
 from theflow import Function
+from theflow.callbacks import run_id__unique
 from theflow.utils.documentation import (
     get_function_documentation,
     get_function_documentation_from_module,
@@ -428,3 +430,48 @@ def test_input_signature_of_run():
     assert list(sum2_input.keys()) == ["a", "b"], "Should ignore args, kwargs"
     assert sum2_args is True, "Should have *args"
     assert sum2_kwargs is True, "Should have **kwargs"
+
+
+def test_input_signature_of_bound_method():
+    class Obj:
+        def run(self, ma: int, mb: str = "") -> int:
+            return ma
+
+    func_input, _, _ = input_signature(Obj().run)
+    assert func_input == {"ma": int, "mb": str}, "Should drop the bound argument"
+    assert input_signature(Obj().run) == input_signature(Obj.run)
+
+
+def test_input_signature_of_bound_varargs_wrapper():
+    def wrapper(*args, **kwargs):
+        pass
+
+    def keyword_only(*args, ma: int):
+        pass
+
+    class Obj:
+        run = wrapper
+        run_kw = keyword_only
+
+    assert input_signature(Obj().run) == ({}, True, True), "Should keep *args"
+    assert input_signature(Obj().run_kw) == ({"ma": int}, True, False)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_run_id_unique_after_fork():
+    run_id__unique(None)
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:  # child
+        os.close(read_fd)
+        os.write(write_fd, run_id__unique(None).encode())
+        os._exit(0)
+
+    os.close(write_fd)
+    child_id = os.read(read_fd, 1024).decode()
+    os.close(read_fd)
+    os.waitpid(pid, 0)
+
+    parent_id = run_id__unique(None)
+    assert child_id and child_id != parent_id
+    assert child_id.split("-")[0] != parent_id.split("-")[0], "Should re-seed prefix"
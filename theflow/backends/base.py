@@ -1,3 +1,4 @@
+import sys
 import threading
 from typing import TYPE_CHECKING
 
@@ -16,6 +17,7 @@ class Backend:
         self._ff_name: dict[int, str] = {}  # only root node has name as empty ""
         self._ff_run_id: dict[int, str] = {}  # the current run id
         self._ff_flow_name: dict[int, str] = {}  # the run name
+        self._ff_abs_path: dict[int, str] = {}  # cached abs_path, from prefix and name
         self._func: "Function"
 
     @property
@@ -38,11 +40,15 @@ class Backend:
 
     @prefix.setter
     def prefix(self, value: str):
-        self._ff_prefix[threading.get_ident()] = value
+        ident = threading.get_ident()
+        self._ff_prefix[ident] = value
+        self._ff_abs_path.pop(ident, None)
 
     @prefix.deleter
     def prefix(self):
-        del self._ff_prefix[threading.get_ident()]
+        ident = threading.get_ident()
+        del self._ff_prefix[ident]
+        self._ff_abs_path.pop(ident, None)
 
     @property
     def name(self) -> str:
@@ -51,11 +57,15 @@ class Backend:
 
     @name.setter
     def name(self, value: str):
-        self._ff_name[threading.get_ident()] = value
+        ident = threading.get_ident()
+        self._ff_name[ident] = value
+        self._ff_abs_path.pop(ident, None)
 
     @name.deleter
     def name(self):
-        del self._ff_name[threading.get_ident()]
+        ident = threading.get_ident()
+        del self._ff_name[ident]
+        self._ff_abs_path.pop(ident, None)
 
     @property
     def run_id(self) -> str:
@@ -115,19 +125,30 @@ class Backend:
             str: absolute path of the node
         """
         ident = threading.get_ident()
+        abs_path = self._ff_abs_path.get(ident)
+        if abs_path is None:
+            abs_path = self._make_abs_path(
+                self._ff_prefix.get(ident, ""), self._ff_name.get(ident, "")
+            )
+            self._ff_abs_path[ident] = abs_path
 
-        if self._ff_prefix.get(ident, "") == ".":
-            return f".{self._ff_name.get(ident, '')}"
+        return abs_path
 
-        return f"{self._ff_prefix.get(ident, '')}.{self._ff_name.get(ident, '')}"
+    @staticmethod
+    def _make_abs_path(prefix: str, name: str) -> str:
+        """Construct the absolute path from prefix and name
+
+        The path is interned as it is repeatedly used to construct context keys.
+        """
+        if prefix == ".":
+            return sys.intern(f".{name}")
+
+        return sys.intern(f"{prefix}.{name}")
 
     def track(self, **kwargs):
         """Track node info
 
-        TODO: this operation is heavily depended on _prepare_child.exec, should make
-        that piece of code relate to this Backend. Otherwise, tough job to maintain 2
-        pieces of code that relate to each other in 2 different places that do not
-        look relate to each other.
+        The kwargs are usually constructed by the parent node with `child_runstates`
         """
         ident = threading.get_ident()
 
@@ -136,6 +157,37 @@ class Backend:
         self._ff_name[ident] = kwargs.get("name", "")
         self._ff_run_id[ident] = kwargs.get("run_id", "")
         self._ff_flow_name[ident] = kwargs.get("flow_name", "")
+        self._ff_abs_path.pop(ident, None)
+
+    def runstates(self) -> dict:
+        """Get the tracking info of the current thread, to be passed to `track`
+
+        Useful to continue the execution flow in another thread.
+        """
+        ident = threading.get_ident()
+        return {
+            "prefix": self._ff_prefix.get(ident, ""),
+            "name": self._ff_name.get(ident, ""),
+            "run_id": self._ff_run_id.get(ident, ""),
+            "flow_name": self._ff_flow_name.get(ident, ""),
+        }
+
+    def child_runstates(self, name: str) -> dict:
+        """Construct the tracking info of a child node, to be passed to its `track`
+
+        Args:
+            name: name of the child node in the function flow
+
+        Returns:
+            the prefix, name, run_id and flow_name of the child node
+        """
+        ident = threading.get_ident()
+        return {
+            "prefix": self.abs_path,
+            "name": name,
+            "run_id": self._ff_run_id.get(ident, ""),
+            "flow_name": self._ff_flow_name.get(ident, ""),
+        }
 
     def clear(self):
         """Clear the tracking info"""
@@ -145,6 +197,7 @@ class Backend:
         self._ff_name.pop(ident, None)
         self._ff_run_id.pop(ident, None)
         self._ff_flow_name.pop(ident, None)
+        self._ff_abs_path.pop(ident, None)
 
     def exec(self, run, args, kwargs):
         """Execute the pipeline's run"""
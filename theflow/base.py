@@ -2,12 +2,16 @@ from __future__ import annotations
 
 import inspect
 import logging
+import sys
+import threading
 from abc import ABCMeta, abstractmethod
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from functools import lru_cache
+from operator import attrgetter
 from typing import _GenericAlias  # type: ignore
 from typing import (
+    TYPE_CHECKING,
     Any,
     Callable,
     ForwardRef,
@@ -28,6 +32,9 @@ try:
 except ImportError:
     _generic_alias_types = (_GenericAlias,)
 
+if TYPE_CHECKING:
+    from .backends.base import Backend
+
 from .config import Config, ConfigProperty, DefaultConfig
 from .context import Context
 from .debug import likely_cyclic_pipeline
@@ -53,6 +60,23 @@ logger = logging.getLogger(__name__)
 
 def is_node_type(annotation) -> bool:
     """Return True if the annotation contains Function"""
+    try:
+        hash(annotation)
+    except TypeError:
+        # unhashable annotation, cannot be cached
+        return _is_node_type.__wrapped__(annotation)
+
+    if annotation in _SCALAR_ANNOTATIONS:
+        return False
+    return _is_node_type(annotation)
+
+
+# common param annotations that can never be nodes
+_SCALAR_ANNOTATIONS = frozenset((int, str, float, bool, bytes, type(None)))
+
+
+@lru_cache(maxsize=None)
+def _is_node_type(annotation) -> bool:
     if is_union_type(annotation):
         return any(is_node_type(a) for a in annotation.__args__)
     if isinstance(annotation, ForwardRef):
@@ -65,6 +89,61 @@ def is_node_type(annotation) -> bool:
     return False
 
 
+def _tuple_getter(names: tuple[str, ...]) -> Callable[[Any], tuple]:
+    """Return a callable that gets the attributes `names` of an object as a tuple"""
+    if not names:
+        return lambda _: ()
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+    return attrgetter(*names)
+
+
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> tuple[str, str | None]:
+    """Split a (.) delimited path into the first name and the rest of the path
+
+    The first name is interned, as it is used for attribute lookup.
+    """
+    path = path.strip(".")
+    if "." in path:
+        name, subpath = path.split(".", 1)
+        return sys.intern(name), subpath
+    return sys.intern(path), None
+
+
+@lru_cache(maxsize=None)
+def _resolve_middleware(
+    middleware: tuple[str, ...], disabled: frozenset[str]
+) -> tuple[type, ...]:
+    """Import the enabled middleware classes, from the innermost to the outermost
+
+    Args:
+        middleware: dotted names of the middleware classes, outermost first
+        disabled: dotted names of the middleware classes that are switched off
+
+    Returns:
+        the middleware classes, in the order they should wrap the run call
+    """
+    return tuple(
+        import_dotted_string(cls_name, safe=False)
+        for cls_name in reversed(middleware)
+        if cls_name not in disabled
+    )
+
+
+def _unflatten_if_dotted(kwargs: dict) -> dict:
+    """Unflatten the kwargs only if any of the keys is dotted
+
+    The kwargs of `set` and `set_run` are usually plain names (e.g. from `__init__`),
+    in which case building a new nested dict is unnecessary.
+    """
+    for key in kwargs:
+        if "." in key:
+            return unflatten_dict(kwargs)
+    return kwargs
+
+
 class unset_:
     def __bool__(self):
         return False
@@ -124,6 +203,25 @@ class Attr(Generic[_Attr]):
 
         self._attrx = self.__class__.__name__
 
+        # select how the value is obtained once, rather than on every access
+        self._is_auto = not isinstance(auto_callback, unset_)
+        self._compute_value: Callable[[Function], _Attr] | None
+        if self._is_auto:
+            self._compute_value = self._compute_auto
+        elif isinstance(default, lazy):
+            self._compute_value = self._compute_lazy_default
+        elif not isinstance(default, unset_):
+            self._compute_value = self._compute_default
+        elif not isinstance(default_callback, unset_):
+            self._compute_value = self._compute_default_callback
+        else:
+            self._compute_value = None
+
+    @property
+    def _qual_name(self) -> str:
+        """Fully qualified name of the attribute, only needed for error messages"""
+        return f"{self._owner.__module__}.{self._owner.__name__}.{self._name}"
+
     def __str__(self):
         text = ", ".join(
             [
@@ -158,47 +256,61 @@ class Attr(Generic[_Attr]):
                 f"{self._qual_name}"
             )
 
-        if not isinstance(self._auto_callback, unset_):
-            if self._name in obj.__ff_cyclic_depends__:
-                raise CyclicDependencyError(
-                    f"Cyclic dependency detected: {self._qual_name}: "
-                    f"{obj.__ff_cyclic_depends__}"
-                )
-            obj.__ff_cyclic_depends__.add(self._name)
-            value = self._auto_calculate_param(obj)
-            obj.__ff_cyclic_depends__.remove(self._name)
-        elif self._name in obj._attrx[self._attrx]:
-            value = obj._attrx[self._attrx][self._name]
-        elif self._default != unset:
-            if isinstance(self._default, lazy):
-                value = self._default()
-            else:
-                value = deepcopy(self._default)
-            value = cast(_Attr, value)
-        elif not isinstance(self._default_callback, unset_):
-            if self._name in obj.__ff_cyclic_depends__:
-                raise CyclicDependencyError(
-                    f"Cyclic dependency detected: {self._qual_name}: "
-                    f"{obj.__ff_cyclic_depends__}"
-                )
-            obj.__ff_cyclic_depends__.add(self._name)
-            value = self._default_callback(obj)
-            obj.__ff_cyclic_depends__.remove(self._name)
-        else:
+        # fast path: the value has been set or computed before
+        stored = obj._attrx[self._attrx]
+        if not self._is_auto and self._name in stored:
+            return stored[self._name]
+
+        if self._compute_value is None:
             return unset  # type: ignore
 
-        obj._attrx[self._attrx][self._name] = value
+        value = self._compute_value(obj)
+        stored[self._name] = value
         return value
 
+    def _compute_auto(self, obj: Function) -> _Attr:
+        """Obtain the value from `auto_callback`"""
+        if self._name in obj._ff_state.cyclic_depends:
+            raise CyclicDependencyError(
+                f"Cyclic dependency detected: {self._qual_name}: "
+                f"{obj._ff_state.cyclic_depends}"
+            )
+        obj._ff_state.cyclic_depends.add(self._name)
+        try:
+            return self._auto_calculate_param(obj)
+        finally:
+            obj._ff_state.cyclic_depends.remove(self._name)
+
+    def _compute_default(self, obj: Function) -> _Attr:
+        """Obtain the value from `default`"""
+        return deepcopy(self._default)
+
+    def _compute_lazy_default(self, obj: Function) -> _Attr:
+        """Obtain the value from the lazy `default`"""
+        return cast(lazy, self._default)()
+
+    def _compute_default_callback(self, obj: Function) -> _Attr:
+        """Obtain the value from `default_callback`"""
+        if self._name in obj._ff_state.cyclic_depends:
+            raise CyclicDependencyError(
+                f"Cyclic dependency detected: {self._qual_name}: "
+                f"{obj._ff_state.cyclic_depends}"
+            )
+        obj._ff_state.cyclic_depends.add(self._name)
+        try:
+            return cast(Callable, self._default_callback)(obj)
+        finally:
+            obj._ff_state.cyclic_depends.remove(self._name)
+
     def __set__(self, obj: Function, value: Any):
-        if self._auto_callback != unset:
+        if self._is_auto:
             raise ValueError(
                 f"Cannot set value for auto-calculated {self._attrx}: {self._qual_name}"
             )
         obj._attrx[self._attrx][self._name] = value
 
     def __delete__(self, obj: Function):
-        if self._auto_callback != unset:
+        if self._is_auto:
             raise ValueError(
                 f"Cannot delete value for auto-calculated parameter: {self._qual_name}"
             )
@@ -209,9 +321,6 @@ class Attr(Generic[_Attr]):
     def __set_name__(self, owner: type, name: str):
         self._name = name
         self._owner = owner
-        self._qual_name = (
-            f"{self._owner.__module__}.{self._owner.__name__}.{self._name}"
-        )
 
         # validate after receiving the name and type for actionable error message
         self._validate_args()
@@ -262,25 +371,33 @@ class Attr(Generic[_Attr]):
                 if isinstance(getattr(obj.__class__, attr), NodeAttr):
                     self._to_check.append(attr)
 
+        stored = obj._attrx[self._attrx]
+        state = obj._ff_state
+        old_ids = (state.depends or {}).get(self._name)
         ids = {}
-        must_recalculate = False
-        for target in self._to_check:
-            old_id = obj.__ff_depends__[self._name].get(target, -1)
-            new_id = id(getattr(obj, target))
-            ids[target] = new_id
 
-            if old_id != new_id:
-                must_recalculate = True
-                break
+        # no need to compare the dependencies if the value has never been calculated
+        must_recalculate = old_ids is None or self._name not in stored
+        if not must_recalculate:
+            for target in self._to_check:
+                new_id = id(getattr(obj, target))
+                ids[target] = new_id
+
+                if cast(dict, old_ids).get(target, -1) != new_id:
+                    must_recalculate = True
+                    break
 
         if must_recalculate:
             value = self._auto_callback(obj)
             # calculate new hash
-            for target in self._to_check:
-                id_ = ids[target] if target in ids else id(getattr(obj, target))
-                obj.__ff_depends__[self._name][target] = id_
+            if state.depends is None:
+                state.depends = {}
+            state.depends[self._name] = {
+                target: ids[target] if target in ids else id(getattr(obj, target))
+                for target in self._to_check
+            }
         else:
-            value = obj._attrx[self._attrx][self._name]
+            value = stored[self._name]
 
         return value
 
@@ -423,7 +540,7 @@ class ParamAttr(Attr[_PAttr]):
         # param-specific attributes
         self._refresh_on_set = refresh_on_set
         self._strict_type = strict_type
-        self._type = None
+        self._type: Any = None  # the annotated type, set by MetaFunction
         self._attrx = "ParamAttr"
 
     def __set__(self, obj: Function, value: Any):
@@ -459,7 +576,7 @@ class ParamAttr(Attr[_PAttr]):
             return self
 
         value = super().__get__(obj, _)
-        if value == unset:
+        if isinstance(value, unset_):
             if obj.config.params_subscribe and obj.fl.prefix:
                 context = f"{obj.fl.flow_qualidx}|published_params"
                 if obj.context.has_context(context):
@@ -468,9 +585,8 @@ class ParamAttr(Attr[_PAttr]):
                         default=unset,
                         context=context,
                     )
-
-        if value != unset:
-            obj._attrx[self._attrx][self._name] = value
+                    if not isinstance(value, unset_):
+                        obj._attrx[self._attrx][self._name] = value
 
         return value
 
@@ -606,6 +722,11 @@ class NodeAttr(Attr[_NAttr]):
             return self
 
         value = super().__get__(obj, _)
+        if value is not None and not isinstance(value, (unset_, Function)):
+            # wrap the raw object on first access, and keep the wrapped one
+            value = obj._convert_to_function(value)
+            obj._attrx[self._attrx][self._name] = value
+
         if obj and value:
             value = cast(_NAttr, value)
             value = obj._prepare_child(value, self._name)
@@ -838,6 +959,8 @@ class MetaFunction(ABCMeta):
             if name.startswith("_"):
                 continue
             if name in attrs and isinstance(attrs[name], (NodeAttr, ParamAttr)):
+                if isinstance(attrs[name], ParamAttr):
+                    attrs[name]._type = value
                 continue
             desc: NodeAttr | ParamAttr
             if is_node_type(value):
@@ -846,6 +969,7 @@ class MetaFunction(ABCMeta):
                 desc = (
                     _param_cls(default=attrs[name]) if name in attrs else _param_cls()
                 )
+                desc._type = value
             attrs[name] = desc
 
         try:
@@ -858,6 +982,8 @@ class MetaFunction(ABCMeta):
                 raise cause from None
             raise e from None
 
+        obj._ff_protected_keywords_set = frozenset(obj._protected_keywords())
+
         # Raise invalid nodes and params
         for name, value in attrs.items():
             if not isinstance(value, (NodeAttr, ParamAttr)):
@@ -865,14 +991,110 @@ class MetaFunction(ABCMeta):
             if name.startswith("_"):
                 raise ValueError(f"Node and param name cannot start with _: {name}")
 
-            if name in obj._protected_keywords():
+            if name in obj._ff_protected_keywords_set:
                 raise ValueError(
                     f'"{name}" is a protected keyword, defined by '
                     f'"{obj._protected_keywords()[name]}"'
                 )
+
+        # registered params and nodes are shared by all instances of the class
+        params, nodes = obj._collect_registered_params_and_nodes()
+        obj._ff_params_names = params
+        obj._ff_nodes_names = nodes
+        obj._ff_params_set = frozenset(params)
+        obj._ff_nodes_set = frozenset(nodes)
+        # staticmethod, as the getter can be a plain function that would otherwise be
+        # bound to the instance
+        obj._ff_params_getter = staticmethod(_tuple_getter(params))  # type: ignore
+        # params and nodes that are not calculated from others, checked by `missing`
+        obj._ff_independent_params = tuple(
+            name for name in params if not getattr(obj, name)._depends_on
+        )
+        obj._ff_independent_nodes = tuple(
+            name for name in nodes if not getattr(obj, name)._depends_on
+        )
+        # auto params and nodes are recalculated on access, the stored value can be
+        # stale
+        obj._ff_auto_set = frozenset(
+            name for name in params + nodes if getattr(obj, name)._is_auto
+        )
         return obj
 
 
+# guards the per-parent child call counters, as children can be called from threads
+_CHILDS_CALLED_LOCK = threading.Lock()
+
+
+class _ChildCall:
+    """Call a child node with the tracking info of its parent"""
+
+    __slots__ = ("parent", "child", "name")
+
+    def __init__(self, parent: Function, child: Function, name: str):
+        self.parent = parent
+        self.child = child
+        self.name = name
+
+    def __call__(self, *args, **kwargs):
+        parent, name = self.parent, self.name
+        with _CHILDS_CALLED_LOCK:
+            state = parent._ff_state
+            childs_called = state.childs_called
+            if childs_called is None:
+                childs_called = state.childs_called = {}
+            called = childs_called.get(name, 0)
+            childs_called[name] = called + 1
+        __fl_runstates__ = parent.fl.child_runstates(
+            f"{name}[{called}]" if called else name
+        )
+        return self.child(*args, **kwargs, __fl_runstates__=__fl_runstates__)
+
+
+class _FunctionState:
+    """The internal state of a Function instance
+
+    It is kept in slots of this separate object rather than in slots of Function, so
+    that user subclasses of Function can still inherit from other slotted classes.
+    """
+
+    __slots__ = (
+        "track_child",
+        "cyclic_depends",
+        "depends",
+        "run_kwargs",
+        "run_temp_kwargs",
+        "backend_spec",
+        "run_tracker",
+        "child_calls",
+        "childs_called",
+        "middleware",
+    )
+
+    track_child: bool  # whether to track the child nodes
+    cyclic_depends: set[str]  # auto values being calculated, to detect cycles
+    depends: dict[str, dict[str, int]] | None  # ids the auto values were computed on
+    run_kwargs: dict[str, Any] | None  # see Function.set_run
+    run_temp_kwargs: dict[str, Any] | None  # reset after execution
+    backend_spec: Any  # spec the current backend is built from
+    run_tracker: tuple[str, RunTracker] | None  # last used (flow_qualidx, RunTracker)
+    child_calls: dict[str, _ChildCall] | None  # see Function._prepare_child
+    childs_called: dict[str, int] | None  # only available for root, reset after run
+    middleware: Callable | None  # the outermost middleware
+
+    def __init__(self):
+        self.track_child = True
+        self.cyclic_depends = set()
+        # allocated on first use, as most functions don't need them
+        self.depends = None
+        self.run_kwargs = None
+        self.run_temp_kwargs = None
+        self.backend_spec = None
+        self.run_tracker = None
+        self.child_calls = None
+        self.childs_called = None
+        self.middleware = None
+
+
 @dataclass_transform(
     eq_default=False,
     kw_only_default=True,
@@ -905,6 +1127,20 @@ class Function(metaclass=MetaFunction):
     Config = DefaultConfig
     config = ConfigProperty()
 
+    # set by MetaFunction for each class
+    _ff_params_names: tuple[str, ...]
+    _ff_nodes_names: tuple[str, ...]
+    _ff_params_set: frozenset[str]  # for membership check
+    _ff_nodes_set: frozenset[str]  # for membership check
+    _ff_params_getter: Callable[[Any], tuple]  # get all params values at once
+    _ff_protected_keywords_set: frozenset[str]  # for membership check
+    _ff_independent_params: tuple[str, ...]  # params without depends_on
+    _ff_independent_nodes: tuple[str, ...]  # nodes without depends_on
+    _ff_auto_set: frozenset[str]  # params and nodes with auto_callback
+
+    # the class of the internal state of each instance
+    _ff_state_cls: type[_FunctionState] = _FunctionState
+
     _keywords = [
         "Config",
         "apply",
@@ -931,34 +1167,50 @@ class Function(metaclass=MetaFunction):
 
     def __init__(self, _params: dict | None = None, /, **params):
         self.last_run: RunTracker
-        self._track_child: bool = True  # flag to track child nodes
-        self._attrx: dict[str, dict[str, Any]] = {
-            "NodeAttr": {},
-            "ParamAttr": {},
-            "AllowExtraParam": {},
-        }
-        self.__ff_cyclic_depends__: set = set()
-        self.__ff_depends__: dict[str, dict[str, int]] = defaultdict(dict)
-        self.__ff_run_kwargs__: dict[str, Any] = {}
-        self._ff_params: list[str] = []
-        self._ff_nodes: list[str] = []
-        self._ff_config: Config = Config(cls=self.__class__)
-        self._ff_context: Context | None = None
-
-        # Initialize temporary execution variables
-        self._variablex()
-
-        # collect
-        self._ff_params, self._ff_nodes = self._collect_registered_params_and_nodes()
+        # declared for type checkers only, as they are set with `object.__setattr__`
+        self.fl: Backend
+        self._ff_state: _FunctionState
+        self._attrx: dict[str, dict[str, Any]]
+        self._ff_params: list[str]
+        self._ff_nodes: list[str]
+        self._ff_config: Config
+        self._ff_context: Context | None
+        self._ff_init_called: bool
+        # internal states are written with `object.__setattr__` to skip the checks in
+        # `Function.__setattr__`, which are only meant for user-facing attributes
+        setattr_ = object.__setattr__
+        setattr_(self, "_ff_state", self._ff_state_cls())
+        setattr_(
+            self,
+            "_attrx",
+            {"NodeAttr": {}, "ParamAttr": {}, "AllowExtraParam": {}},
+        )
+        setattr_(self, "_ff_params", list(self._ff_params_names))
+        setattr_(self, "_ff_nodes", list(self._ff_nodes_names))
+        setattr_(self, "_ff_config", Config(cls=self.__class__))
+        setattr_(self, "_ff_context", None)
 
-        self._ff_init_called = False
+        setattr_(self, "_ff_init_called", False)
         if _params:
             self.set(_params, strict=True)
         if params:
             self.set(params, strict=True)
-        self._ff_init_called = True
+        setattr_(self, "_ff_init_called", True)
 
         # collect middleware
+        middleware = None
+        if middleware_classes := self._middleware_classes():
+            middleware = self._chain_middleware(self._runx, middleware_classes)
+        self._ff_state.middleware = middleware
+
+        # check the instance dict rather than hasattr, which raises and catches an
+        # AttributeError when missing (through `__getattr__` for ProxyFunction)
+        if "_ff_initializing" not in self.__dict__:
+            # TODO: this work better if we formulate config and context as independent
+            self._initialize()
+
+    def _middleware_classes(self) -> tuple[type, ...]:
+        """Get the enabled middleware classes, from the innermost to the outermost"""
         middleware_section: str = self.config.middleware_section
         middleware_setting = settings.MIDDLEWARE
         if middleware_section not in middleware_setting:
@@ -967,26 +1219,31 @@ class Function(metaclass=MetaFunction):
             )
         middleware_switches = self.config.middleware_switches
 
-        self._middleware = None
-        if middlware_cfg := middleware_setting[middleware_section]:
-            next_call = self._runx
-            for cls_name in reversed(middlware_cfg):
-                if not middleware_switches.get(cls_name, True):
-                    continue
-                cls = import_dotted_string(cls_name, safe=False)
-                next_call = cls(obj=self, next_call=next_call)
-            self._middleware = next_call
+        return _resolve_middleware(
+            tuple(middleware_setting[middleware_section] or ()),
+            frozenset(
+                cls_name
+                for cls_name, enabled in middleware_switches.items()
+                if not enabled
+            ),
+        )
 
-        if not hasattr(self, "_ff_initializing"):
-            # TODO: this work better if we formulate config and context as independent
-            self._initialize()
+    def _chain_middleware(
+        self, call: Callable, middleware_classes: tuple[type, ...]
+    ) -> Callable:
+        """Wrap `call` with the middleware classes (innermost first), return the
+        outermost middleware"""
+        for cls in middleware_classes:
+            call = cls(obj=self, next_call=call)
+        return call
 
     def _variablex(self):
-        """Set temporary variables, only available during execution. Refresh when
+        """Reset temporary variables, only available during execution. Refresh when
         execution finishes
         """
-        self.__ff_run_temp_kwargs__: dict[str, Any] = {}  # temp run kwargs
-        self._ff_childs_called: dict = {}  # only available for root
+        state = self._ff_state
+        state.run_temp_kwargs = None
+        state.childs_called = None
 
     def __rshift__(self, other: Function) -> Any:
         """Return a sequential function"""
@@ -1026,14 +1283,19 @@ class Function(metaclass=MetaFunction):
 
     def __call__(self, *args, **kwargs):
         """Run the flow, accepting extra parameters for routing purpose"""
-        if not hasattr(self, "_ff_initializing"):
+        if "_ff_initializing" not in self.__dict__:
             self._initialize()
 
+        # bind the frequently used attributes once, the backend and context don't
+        # change during a call. The context is set by `_initialize`
+        fl, context, config = self.fl, cast(Context, self._ff_context), self.config
+        state = self._ff_state
+
         # might not need to pop __fl_runstates__, because it can be used by other
         # operations of the Backend.
         _tfrs = kwargs.pop("__fl_runstates__", {})
         if _tfrs:
-            self.fl.track(**_tfrs)
+            fl.track(**_tfrs)
 
         if _ff_run_kwargs := kwargs.pop("_ff_run_kwargs", {}):
             # TODO: another option is to communicate through context,
@@ -1041,7 +1303,8 @@ class Function(metaclass=MetaFunction):
             # child nodes.
             self.set_run(_ff_run_kwargs, temp=True)
 
-        if not self.fl.prefix:  # only root node has prefix as empty
+        is_root = not fl.prefix  # only root node has prefix as empty
+        if is_root:
             # check validity
             has_cycle, evidence = likely_cyclic_pipeline(self)
             if has_cycle:
@@ -1049,54 +1312,43 @@ class Function(metaclass=MetaFunction):
                     f"Potential cyclic pipeline, please check: {evidence[:5]}"
                 )
             # administrative setup
-            self.fl.run_id = self.config.run_id
-            self.fl.flow_name = self.config.function_name
-            self.context.create_context(context=self.fl.flow_qualidx)
-            self.context.set("run_id", self.fl.run_id, context=self.fl.flow_qualidx)
+            fl.run_id = config.run_id
+            fl.flow_name = config.function_name
+            flow_qualidx = fl.flow_qualidx
+            context.create_context(context=flow_qualidx)
+            context.set("run_id", fl.run_id, context=flow_qualidx)
 
             # publish parameters to the shared cache
-            if self.config.params_publish:
-                self.context.create_context(
-                    context=f"{self.fl.flow_qualidx}|published_params",
+            if config.params_publish:
+                published_context = context.create_context(
+                    context=f"{flow_qualidx}|published_params",
+                )
+                context.update(
+                    {**self.params, **self._attrx["AllowExtraParam"]},
+                    context=published_context,
                 )
-                for k, v in self.params.items():
-                    self.context.set(
-                        name=k,
-                        value=v,
-                        context=f"{self.fl.flow_qualidx}|published_params",
-                    )
-                for k, v in self._attrx["AllowExtraParam"].items():
-                    self.context.set(
-                        name=k,
-                        value=v,
-                        context=f"{self.fl.flow_qualidx}|published_params",
-                    )
 
-        self.context.create_context(context=self.fl.qualidx, exist_ok=True)
+        context.create_context(context=fl.qualidx, exist_ok=True)
 
         # TODO: this will override kwargs passed in __call__. Should follow the
         # context-based parameters sharing method
         # TODO: this will raise errors in case the users pass in a lot of parameters
         # and some of them don't appear in the .run method.
-        if self.__ff_run_kwargs__:
-            kwargs.update(self.__ff_run_kwargs__)
+        if state.run_kwargs:
+            kwargs.update(state.run_kwargs)
 
-        if self.__ff_run_temp_kwargs__:
-            kwargs.update(self.__ff_run_temp_kwargs__)
+        if state.run_temp_kwargs:
+            kwargs.update(state.run_temp_kwargs)
 
         try:
-            func = self._middleware if self._middleware else self._runx
-            output = self.fl.exec(func, args, kwargs)
-
-            if not self.fl.prefix:  # only root node has prefix as empty
-                if self.config.params_publish:
-                    self.context.clear(
-                        None,
-                        context=f"{self.fl.flow_qualidx}|published_params",
-                    )
+            func = state.middleware or self._runx
+            output = fl.exec(func, args, kwargs)
+
+            if is_root and config.params_publish:
+                context.clear(None, context=f"{fl.flow_qualidx}|published_params")
         except Exception as e:
             self._variablex()
-            self.fl.clear()
+            fl.clear()
             raise e from None
 
         if inspect.isgenerator(output):
@@ -1104,18 +1356,25 @@ class Function(metaclass=MetaFunction):
             def cleanup(wrapped):
                 yield from wrapped
                 self._variablex()
-                self.fl.clear()
+                fl.clear()
 
             output = cleanup(output)
         else:
             self._variablex()
-            self.fl.clear()
+            fl.clear()
 
         return output
 
     def __repr__(self):
+        try:
+            values = self._ff_params_getter(self)
+        except AttributeError:
+            values = tuple(getattr(self, key, None) for key in self._ff_params_names)
         kwargs = ", ".join(
-            [f"{key}={repr(getattr(self, key, None))}" for key in self._ff_params]
+            [
+                f"{key}={repr(value)}"
+                for key, value in zip(self._ff_params_names, values)
+            ]
         )
         return f"{self.__class__.__name__}({kwargs})"
 
@@ -1156,6 +1415,12 @@ class Function(metaclass=MetaFunction):
 
     @property
     def params(self) -> dict[str, Any]:
+        try:
+            return dict(zip(self._ff_params_names, self._ff_params_getter(self)))
+        except Exception:
+            pass
+
+        # fall back to get the params one by one, so that a failing param is None
         params = {}
         for key in self._ff_params:
             try:
@@ -1165,13 +1430,17 @@ class Function(metaclass=MetaFunction):
         return params
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if name.startswith("_"):
+        # private attributes, params and nodes are the most common writes, and they
+        # don't need any special handling (non-Function nodes are wrapped lazily when
+        # they are accessed, see `NodeAttr.__get__`)
+        if (
+            name.startswith("_")
+            or name in self._ff_params_set
+            or name in self._ff_nodes_set
+        ):
             return super().__setattr__(name, value)
 
-        if name in self._ff_nodes:
-            if not isinstance(value, Function):
-                value = self._convert_to_function(value)
-        elif name not in self._ff_params and name not in self._protected_keywords():
+        if name not in self._ff_protected_keywords_set:
             if self.config.allow_extra:
                 self._attrx["AllowExtraParam"][name] = value
             else:
@@ -1185,11 +1454,15 @@ class Function(metaclass=MetaFunction):
         if self._ff_context is None:
             self._ff_context = deserialize(settings.CONTEXT, safe=False)
 
-        # Initialize the backend
-        self.fl = deserialize(self.config.default_backend, safe=False)
-        self.fl.attach(self)
+        # Initialize the backend, only rebuild it if the backend spec has changed
+        backend_spec = self.config.default_backend
+        if "fl" not in self.__dict__ or backend_spec != self._ff_state.backend_spec:
+            fl = deserialize(backend_spec, safe=False)
+            fl.attach(self)
+            object.__setattr__(self, "fl", fl)
+            self._ff_state.backend_spec = backend_spec
 
-        if not hasattr(self, "_ff_init_called"):
+        if "_ff_init_called" not in self.__dict__:
             raise RuntimeError(
                 "Please call super().__init__(**params) in your __init__ method"
             )
@@ -1199,21 +1472,27 @@ class Function(metaclass=MetaFunction):
         self._ff_initializing = False
 
     @classmethod
-    def _collect_registered_params_and_nodes(cls) -> tuple[list[str], list[str]]:
-        """Return the list of all params and nodes registered in the Function
+    def _collect_registered_params_and_nodes(
+        cls,
+    ) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Return the names of all params and nodes registered in the Function
+
+        This is called once per class by `MetaFunction`, read `_ff_params_names` and
+        `_ff_nodes_names` instead.
 
         Returns:
-            tuple[list[str], list[str]]: params, nodes
+            tuple[tuple[str, ...], tuple[str, ...]]: params, nodes
         """
         params, nodes = [], []
 
         for attr in dir(cls):
-            if isinstance(getattr(cls, attr), NodeAttr):
+            value = getattr(cls, attr)
+            if isinstance(value, NodeAttr):
                 nodes.append(attr)
-            elif isinstance(getattr(cls, attr), ParamAttr):
+            elif isinstance(value, ParamAttr):
                 params.append(attr)
 
-        return list(sorted(set(params))), list(sorted(set(nodes)))
+        return tuple(sorted(set(params))), tuple(sorted(set(nodes)))
 
     @classmethod
     @lru_cache
@@ -1249,30 +1528,25 @@ class Function(metaclass=MetaFunction):
 
     def _prepare_child(self, child: _F, name: str) -> _F:
         """Prepare child node to enable tracking and routing"""
-        if not hasattr(self, "fl"):
+        if "fl" not in self.__dict__:
             return child
 
         if not self.fl.in_run:
             return child
 
-        if not self._track_child:
+        state = self._ff_state
+        if not state.track_child:
             return child
 
-        def exec(*args, **kwargs):
-            __fl_runstates__ = {
-                "prefix": self.fl.abs_path,
-                "name": (
-                    name
-                    if name not in self._ff_childs_called
-                    else f"{name}[{self._ff_childs_called[name]}]"
-                ),
-                "run_id": self.fl.run_id,
-                "flow_name": self.fl.flow_name,
-            }
-            self._ff_childs_called[name] = self._ff_childs_called.get(name, 0) + 1
-            return child(*args, **kwargs, __fl_runstates__=__fl_runstates__)
+        # the call wrapper only depends on the name and the child, reuse it
+        child_calls = state.child_calls
+        if child_calls is None:
+            child_calls = state.child_calls = {}
+        child_call = child_calls.get(name)
+        if child_call is None or child_call.child is not child:
+            child_call = child_calls[name] = _ChildCall(self, child, name)
 
-        return exec  # type: ignore
+        return child_call  # type: ignore
 
     @classmethod
     def visualize(cls):
@@ -1295,18 +1569,37 @@ class Function(metaclass=MetaFunction):
         return lazy(cls, **kwargs)
 
     def apply(self, fn: Callable):
-        """Apply a function recursively to all nodes in a pipeline"""
-        for node in self._ff_nodes:
-            getattr(self, node).apply(fn)
-        fn(self)
+        """Apply a function recursively to all nodes in a pipeline
+
+        The nodes are visited in post-order (child nodes before the parent node). Each
+        node is visited once, even if it is shared or the pipeline is cyclic.
+        """
+        seen: set[int] = set()
+        stack: list[tuple[Function, bool]] = [(self, False)]
+        while stack:
+            func, children_visited = stack.pop()
+            if children_visited:
+                fn(func)
+                continue
+
+            if id(func) in seen:
+                continue
+            seen.add(id(func))
+
+            stack.append((func, True))
+            for node in reversed(func._ff_nodes):
+                child = getattr(func, node)
+                if isinstance(child, Function):
+                    stack.append((child, False))
+
         return self
 
     def set(self, kwargs: dict, strict: bool = False):
         """Set the keyword arguments in the function"""
-        kwargs = unflatten_dict(kwargs)
+        kwargs = _unflatten_if_dotted(kwargs)
         for name, value in kwargs.items():
             name = name.strip(".")
-            if name in self._ff_nodes and isinstance(value, dict):
+            if name in self._ff_nodes_set and isinstance(value, dict):
                 getattr(self, name).set(value, strict=strict)
             else:
                 try:
@@ -1334,16 +1627,21 @@ class Function(metaclass=MetaFunction):
         # Nevertheless, a good abstraction of the context will provide much
         # versatility to the users.
         """
-        kwargs = unflatten_dict(kwargs)
+        kwargs = _unflatten_if_dotted(kwargs)
         for name, value in kwargs.items():
             name = name.strip(".")
-            if name in self._ff_nodes and isinstance(value, dict):
+            if name in self._ff_nodes_set and isinstance(value, dict):
                 getattr(self, name).set_run(value, temp=temp)
             else:
+                state = self._ff_state
                 if temp:
-                    self.__ff_run_temp_kwargs__[name] = value
+                    if state.run_temp_kwargs is None:
+                        state.run_temp_kwargs = {}
+                    state.run_temp_kwargs[name] = value
                 else:
-                    self.__ff_run_kwargs__[name] = value
+                    if state.run_kwargs is None:
+                        state.run_kwargs = {}
+                    state.run_kwargs[name] = value
 
     @classmethod
     def describe(cls) -> dict:
@@ -1351,36 +1649,57 @@ class Function(metaclass=MetaFunction):
 
         TODO: export the route of the flow as well
         """
-        params, nodes = {}, {}
-
-        for attr in dir(cls):
-            attr_value = getattr(cls, attr)
-            if isinstance(attr_value, NodeAttr):
+        # walk the default nodes with an explicit stack rather than recursion, each
+        # description is created empty and filled in when its class is popped. Each
+        # entry carries the classes on its path, to stop on a cyclic default
+        description: dict = {}
+        stack: list[tuple[type[Function], dict, frozenset[int]]] = [
+            (cls, description, frozenset((id(cls),)))
+        ]
+        while stack:
+            each_cls, each_desc, ancestors = stack.pop()
+            params, nodes = {}, {}
+
+            for attr in each_cls._ff_nodes_names:
+                attr_value = getattr(each_cls, attr)
                 value = attr_value.__persist_flow__()
                 if isinstance(attr_value._default, lazy) and issubclass(
                     attr_value._default._cls, Function
                 ):
-                    value[
-                        "default"
-                    ] = attr_value._default._cls.describe()  # type:ignore
+                    child_cls = attr_value._default._cls
+                    if id(child_cls) in ancestors:
+                        raise CyclicPipelineError(
+                            f"Cyclic default node: {each_cls.__qualname__}.{attr} "
+                            f"is a {child_cls.__qualname__}"
+                        )
+                    value["default"] = {}
+                    stack.append(
+                        (child_cls, value["default"], ancestors | {id(child_cls)})
+                    )
                     value["default_kwargs"] = {
                         key: value
                         for key, value in attr_value._default._params.items()
                         if not isinstance(value, lazy)
                     }
                 nodes[attr] = value
-            elif isinstance(attr_value, ParamAttr):
+
+            for attr in each_cls._ff_params_names:
+                attr_value = getattr(each_cls, attr)
                 attr_val = attr_value.__persist_flow__()
                 attr_val["type"] = repr(
                     attr_value._owner.__annotations__.get(attr_value._name, Any)
                 )
                 params[attr] = attr_val
 
-        return {
-            "type": f"{cls.__module__}.{cls.__qualname__}",
-            "params": params,
-            "nodes": nodes,
-        }
+            each_desc.update(
+                {
+                    "type": f"{each_cls.__module__}.{each_cls.__qualname__}",
+                    "params": params,
+                    "nodes": nodes,
+                }
+            )
+
+        return description
 
     def dump(self, ignore_auto: bool = True, strict: bool = True) -> dict:
         """Export the flow to a dictionary
@@ -1396,7 +1715,7 @@ class Function(metaclass=MetaFunction):
         for node in self._ff_nodes:
             try:
                 obj: Function = self.get_from_path(node)
-                if self.specs(node).get("auto_callback", unset) and ignore_auto:
+                if self._attr_specs(node).get("auto_callback", unset) and ignore_auto:
                     continue
                 nodes[node] = obj.dump(ignore_auto=ignore_auto, strict=strict)
             except Exception as e:
@@ -1407,7 +1726,7 @@ class Function(metaclass=MetaFunction):
 
         params = {}
         for name, value in self.params.items():
-            if self.specs(name).get("auto_callback", []) and ignore_auto:
+            if self._attr_specs(name).get("auto_callback", []) and ignore_auto:
                 continue
             try:
                 params[name] = serialize(value)
@@ -1432,15 +1751,30 @@ class Function(metaclass=MetaFunction):
         Returns:
             the specification of the param or node
         """
-        path = path.strip(".")
+        cls, name = self._resolve_declaring_class(path)
+        # copy so that the cached specs can't be modified by the caller, the defaults
+        # are returned as is
+        spec = cls._attr_specs(name)
+        if "input" in spec and type(spec["input"]) is dict:
+            return {**spec, "input": dict(spec["input"])}
+        return dict(spec)
+
+    def _resolve_declaring_class(self, path: str) -> tuple[type[Function], str]:
+        """Get the Function class that declares the last name in path, and that name"""
+        obj = self
+        name, subpath = _split_path(path)
+        while subpath is not None:
+            obj = getattr(obj, name)
+            name, subpath = _split_path(subpath)
+        return type(obj), name
 
-        if "." in path:
-            module, subpath = path.split(".", 1)
-            return getattr(self, module).specs(subpath)
-
-        definition = getattr(self.__class__, path)
+    @classmethod
+    @lru_cache
+    def _attr_specs(cls, name: str) -> dict:
+        """Get specification about a param or a node declared in this class"""
+        definition = getattr(cls, name)
         if not isinstance(definition, (ParamAttr, NodeAttr)):
-            raise ValueError(f"{path} is not a param or a node")
+            raise ValueError(f"{name} is not a param or a node")
 
         return definition.to_dict()
 
@@ -1454,28 +1788,78 @@ class Function(metaclass=MetaFunction):
         return self[path]
 
     def missing(self) -> dict[str, list[str]]:
-        """Return the list of missing params and nodes"""
-        params, nodes = [], []
-        for attr in self._ff_params:
-            if getattr(self.__class__, attr)._depends_on:
+        """Return the list of missing params and nodes
+
+        Raises:
+            CyclicPipelineError: if a node is (directly or indirectly) its own child
+        """
+        params: list[str] = []
+        nodes: list[str] = []
+
+        # walk the nodes depth-first with an explicit stack, each entry is one of:
+        #   (func, prefix): collect what is missing in `func`
+        #   path (str): report the node at `path` as missing
+        #   id(func) (int): `func` and its children are done
+        # only the functions that have child functions are tracked for cycles
+        ancestors: set[int] = set()
+        stack: list[tuple[Function, str] | str | int] = [(self, "")]
+        while stack:
+            entry = stack.pop()
+            if type(entry) is str:
+                nodes.append(entry)
+                continue
+            if type(entry) is int:
+                ancestors.discard(entry)
                 continue
-            try:
-                getattr(self, attr)
-            except Exception:
-                params.append(attr)
 
-        for attr in self._ff_nodes:
-            if getattr(self.__class__, attr)._depends_on:
+            func, prefix = entry  # type: ignore[misc]
+            func_cls = type(func)
+            # values that are already set are read directly, skipping the descriptors
+            auto_set = func_cls._ff_auto_set
+            stored_params = func._attrx["ParamAttr"]
+            for attr in func_cls._ff_independent_params:
+                value = unset if attr in auto_set else stored_params.get(attr, unset)
+                if isinstance(value, unset_):
+                    # unset params are returned as `unset` rather than raising
+                    try:
+                        value = getattr(func, attr)
+                    except Exception:
+                        value = unset
+                    if isinstance(value, unset_):
+                        params.append(prefix + attr)
+
+            independent_nodes = func_cls._ff_independent_nodes
+            if not independent_nodes:
                 continue
-            try:
-                child = getattr(self, attr)
-                missings = child.missing()
-                for each in missings["params"]:
-                    params.append(f"{attr}.{each}")
-                for each in missings["nodes"]:
-                    nodes.append(f"{attr}.{each}")
-            except Exception:
-                nodes.append(attr)
+
+            childs: list[tuple[Function, str] | str] = []
+            has_func_child = False
+            stored_nodes = func._attrx["NodeAttr"]
+            for attr in independent_nodes:
+                child: Any = None if attr in auto_set else stored_nodes.get(attr)
+                # checked on the metaclass, as `isinstance` on the abstract Function
+                # goes through the slower ABCMeta.__instancecheck__
+                if not isinstance(type(child), MetaFunction):
+                    try:
+                        child = getattr(func, attr)
+                    except Exception:
+                        child = None
+                if isinstance(type(child), MetaFunction):
+                    childs.append((child, f"{prefix}{attr}."))
+                    has_func_child = True
+                else:
+                    childs.append(prefix + attr)
+
+            if has_func_child:
+                func_id = id(func)
+                if func_id in ancestors:
+                    raise CyclicPipelineError(
+                        f"Cyclic pipeline, {prefix.rstrip('.')} is its own child"
+                    )
+                ancestors.add(func_id)
+                stack.append(func_id)
+            # reversed, so that the nodes are reported in the declared order
+            stack.extend(reversed(childs))
 
         return {"params": params, "nodes": nodes}
 
@@ -1504,18 +1888,22 @@ class Function(metaclass=MetaFunction):
         Returns:
             Node or param, depending on the path
         """
-        self._track_child = False
-        path = path.strip(".")
+        obj = self
+        while True:
+            name, subpath = _split_path(path)
+            parent = obj
+            parent._ff_state.track_child = False
+            try:
+                obj = getattr(parent, name)
+            finally:
+                parent._ff_state.track_child = True
 
-        if "." in path:
-            module, subpath = path.split(".", 1)
-            obj = getattr(self, module)
-            self._track_child = True
-            return obj[subpath]
-
-        obj = getattr(self, path)
-        self._track_child = True
-        return obj
+            if subpath is None:
+                return obj
+            if not isinstance(obj, Function):
+                # let the object resolve the rest of the path itself
+                return obj[subpath]
+            path = subpath
 
     def is_compatible(self, path, obj) -> bool:
         """Check if the interface of a sample is compatible with the declared interface
@@ -1527,38 +1915,34 @@ class Function(metaclass=MetaFunction):
         Returns:
             True if compatible, False otherwise
         """
-        specs = self.specs(path)
+        cls, name = self._resolve_declaring_class(path)
+        specs = cls._attr_specs(name)
+        # take `run` from the class, so that its signature is looked up (and cached,
+        # see `input_signature`) by the plain function
         func = obj
         if isinstance(obj, Function):
-            func = obj.run
+            func = type(obj).run
         elif isinstance(obj, type) and issubclass(obj, Function):
             func = obj.run
 
         if specs["__type__"] == "theflow.base.ParamAttr":
-            return isinstance(obj, specs["type"])
+            # the specs don't carry the annotated type, get it from the declaration
+            declared_type = getattr(cls, name)._type
+            return declared_type is None or is_compatible_with(type(obj), declared_type)
         elif specs["__type__"] == "theflow.base.NodeAttr":
             reference_input = specs["input"]
-            reference_output = specs["output"]
-            target_input, _, _ = input_signature(func)
-            target_output = output_signature(func)
+            if not isinstance(reference_input, unset_):
+                target_input, _, _ = input_signature(func)
+                if reference_input.keys() - target_input.keys():
+                    return False
+                for arg, annot in reference_input.items():
+                    if not is_compatible_with(target_input[arg], annot):
+                        return False
 
-            ok_input, ok_output = False, False
-            if reference_input == unset:
-                ok_input = True
-            else:
-                for name, annot in reference_input.items():
-                    if name not in target_input:
-                        ok_input = False
-                        break
-                    ok_input = is_compatible_with(target_input[name], annot)
-                    if not ok_input:
-                        break
-
-            if reference_output == unset:
-                ok_output = True
-            else:
-                ok_output = is_compatible_with(target_output, reference_output)
-            return ok_input and ok_output
+            reference_output = specs["output"]
+            if isinstance(reference_output, unset_):
+                return True
+            return is_compatible_with(output_signature(func), reference_output)
 
         raise ValueError(f"{path} is not a param or a node")
 
@@ -1567,8 +1951,18 @@ class Function(metaclass=MetaFunction):
         if name is None:
             name = self.fl.abs_path
 
-        run_tracker = RunTracker(self)
-        run_tracker.log_progress(name, **kwargs)
+        # reuse the tracker of the same run, as creating one costs cache round-trips
+        state = self._ff_state
+        cached = state.run_tracker
+        flow_qualidx = self.fl.flow_qualidx
+        if (
+            cached is None
+            or cached[0] != flow_qualidx
+            or cached[1]._context is not self.context
+        ):
+            cached = (flow_qualidx, RunTracker(self))
+            state.run_tracker = cached
+        cached[1].log_progress(name, **kwargs)
 
     def __persist_flow__(self) -> dict:
         """Persist function into a re-constructable JSON-serializable dictionary"""
@@ -1578,7 +1972,7 @@ class Function(metaclass=MetaFunction):
 
         for name, value in self.params.items():
             # ignore auto parameter
-            if self.specs(name).get("auto_callback", []):
+            if self._attr_specs(name).get("auto_callback", []):
                 continue
             try:
                 export[name] = serialize(value)
@@ -1587,7 +1981,7 @@ class Function(metaclass=MetaFunction):
                 continue
 
         for name in self._ff_nodes:
-            if self.specs(name).get("auto_callback", []):
+            if self._attr_specs(name).get("auto_callback", []):
                 continue
             node = self.get_from_path(name).__persist_flow__()
             export[name] = node
@@ -1599,7 +1993,7 @@ class SessionFunction(Function):
     """Handle sesssion"""
 
     def start_session(self):
-        if not hasattr(self, "_ff_initializing"):
+        if "_ff_initializing" not in self.__dict__:
             self._initialize()
 
         if not self.fl.prefix:  # only root node has prefix as empty
@@ -1618,15 +2012,16 @@ class SessionFunction(Function):
             # child nodes.
             self.set_run(_ff_run_kwargs, temp=True)
 
-        if self.__ff_run_kwargs__:
-            kwargs.update(self.__ff_run_kwargs__)
+        state = self._ff_state
+        if state.run_kwargs:
+            kwargs.update(state.run_kwargs)
 
-        if self.__ff_run_temp_kwargs__:
-            kwargs.update(self.__ff_run_temp_kwargs__)
+        if state.run_temp_kwargs:
+            kwargs.update(state.run_temp_kwargs)
 
         output = (
-            self._middleware(*args, **kwargs)
-            if self._middleware
+            state.middleware(*args, **kwargs)
+            if state.middleware
             else self._runx(*args, **kwargs)
         )
 
@@ -1637,6 +2032,73 @@ class SessionFunction(Function):
         self.fl.clear()
 
 
+class _ProxyCall:
+    """Call a callable of the object wrapped by a ProxyFunction, with tracking
+
+    This is a class rather than a closure so that it can be pickled and copied along
+    with the ProxyFunction.
+    """
+
+    __slots__ = ("proxy", "call")
+
+    def __init__(self, proxy: ProxyFunction, call: Callable):
+        self.proxy = proxy
+        self.call = call
+
+    def __call__(self, *args, **kwargs):
+        proxy = self.proxy
+        if "_ff_initializing" not in proxy.__dict__:
+            proxy._initialize()
+
+        _tfrs = kwargs.pop("__fl_runstates__", {})
+        if _tfrs:
+            proxy.fl.track(**_tfrs)
+
+        try:
+            output = self.call(*args, **kwargs)
+        except Exception as e:
+            raise e from None
+        finally:
+            proxy.fl.clear()
+
+        return output
+
+
+class _UntrackedProxyCall:
+    """Call a callable of the object wrapped by a ProxyFunction that has no middleware,
+    only the tracking info from the parent is dropped"""
+
+    __slots__ = ("call",)
+
+    def __init__(self, call: Callable):
+        self.call = call
+
+    def __call__(self, *args, **kwargs):
+        kwargs.pop("__fl_runstates__", None)
+        return self.call(*args, **kwargs)
+
+
+class _CallableCache(dict):
+    """Cache of wrapped callables, it is dropped (rather than copied) when the owner
+    is pickled or copied as it is cheap to rebuild"""
+
+    def __reduce__(self):
+        return (self.__class__, ())
+
+
+class _ProxyFunctionState(_FunctionState):
+    """The internal state of a ProxyFunction instance"""
+
+    __slots__ = ("callables",)
+
+    # {name: (original callable, wrapped callable)}, see `ProxyFunction._get_callable`
+    callables: _CallableCache
+
+    def __init__(self):
+        super().__init__()
+        self.callables = _CallableCache()
+
+
 class ProxyFunction(Function):
     """Wrap an object to be a step.
 
@@ -1650,9 +2112,17 @@ class ProxyFunction(Function):
     Raise ValueError in case of conflict.
     """
 
-    ff_original_obj: Callable
+    # refresh, so that the callables of the replaced object are dropped
+    ff_original_obj: Callable = Param(refresh_on_set=True)
+
+    # resolve the methods of the original object in one C-level call
+    _ff_call_getter = attrgetter("ff_original_obj.__call__")
+    _ff_run_getter = attrgetter("ff_original_obj.run")
+
+    _ff_state_cls = _ProxyFunctionState
 
     def __init__(self, **params):
+        self._ff_state: _ProxyFunctionState
         super().__init__(**params)
         if isinstance(self.ff_original_obj, ProxyFunction):
             raise ValueError(
@@ -1660,67 +2130,75 @@ class ProxyFunction(Function):
             )
 
     def _create_callable(self, callable_obj):
-        middleware_section: str = self.config.middleware_section
-        middleware_setting = settings.MIDDLEWARE
-        if middleware_section not in middleware_setting:
-            raise ValueError(
-                f'Middleware section "{middleware_section}" not found in settings'
-            )
-        middleware_switches = self.config.middleware_switches
-
-        if middlware_cfg := middleware_setting[middleware_section]:
-            next_call = callable_obj
-            for cls_name in reversed(middlware_cfg):
-                if not middleware_switches.get(cls_name, True):
-                    continue
-                cls = import_dotted_string(cls_name, safe=False)
-                next_call = cls(obj=self, next_call=next_call)
-            callable_obj = next_call
+        middleware_classes = self._middleware_classes()
+        if not middleware_classes:
+            # the tracking info is only used by the middleware
+            return _UntrackedProxyCall(callable_obj)
 
-        def wrapper(*args, **kwargs):
-            if not hasattr(self, "_ff_initializing"):
-                self._initialize()
+        callable_obj = self._chain_middleware(callable_obj, middleware_classes)
+        return _ProxyCall(self, callable_obj)
 
-            _tfrs = kwargs.pop("__fl_runstates__", {})
-            if _tfrs:
-                self.fl.track(**_tfrs)
+    def _get_callable(self, name: str, callable_obj: Callable) -> Callable:
+        """Get the wrapped `callable_obj`, which is `ff_original_obj.<name>`
 
-            try:
-                output = callable_obj(*args, **kwargs)
-            except Exception as e:
-                raise e from None
-            finally:
-                self.fl.clear()
+        The wrapped callable is reused as long as the original object still returns
+        the same callable for that name (bound methods compare equal when they bind
+        the same function to the same object).
+        """
+        callables = self._ff_state.callables
+        cached = callables.get(name)
+        if cached is not None and cached[0] == callable_obj:
+            return cached[1]
 
-            return output
+        wrapped = self._create_callable(callable_obj)
+        callables[name] = (callable_obj, wrapped)
+        return wrapped
 
-        return wrapper
+    def _initialize(self):
+        # the wrapped callables are bound to the original object and chained with the
+        # middleware of the current config, drop them and the exposed ones
+        callables = self._ff_state.callables
+        for name in callables:
+            self.__dict__.pop(name, None)
+        callables.clear()
+        super()._initialize()
 
     def __call__(self, *args, **kwargs):
-        if self._ff_context is None:
-            self._ff_context = deserialize(settings.CONTEXT, safe=False)
-
-        return self._create_callable(getattr(self.ff_original_obj, "__call__"))(
+        return self._get_callable("__call__", self._ff_call_getter(self))(
             *args, **kwargs
         )
 
     def __getattr__(self, name):
-        if "ff_original_obj" not in self._ff_params:
+        # internal states and dunder lookups (e.g. by copy and pickle, possibly before
+        # __init__) are never forwarded to the original object
+        if (
+            name.startswith("_ff_")
+            or (name.startswith("__") and name.endswith("__"))
+            or "ff_original_obj" not in type(self)._ff_params_set
+        ):
             raise AttributeError(
                 f"{self.__class__.__qualname__} object has no attribute {name}"
             )
 
-        if self._ff_context is None:
-            self._ff_context = deserialize(settings.CONTEXT, safe=False)
-
-        attr = getattr(self.ff_original_obj, name)
+        original_obj = self.ff_original_obj
+        attr = getattr(original_obj, name)
         if callable(attr):
-            attr = self._create_callable(attr)
+            is_method = getattr(attr, "__self__", None) is original_obj
+            attr = self._get_callable(name, attr)
+            if is_method and name not in getattr(original_obj, "__dict__", {}):
+                # methods of the original object's class don't change, expose them on
+                # the instance so that later accesses don't come to `__getattr__`.
+                # They are removed by `_initialize`, e.g. when the object is replaced
+                self.__dict__[name] = attr
         return attr
 
     def run(self, *args, **kwargs) -> Any:
-        if hasattr(self.ff_original_obj, "run") and callable(self._ff_original_obj.run):
-            return self.ff_original_obj.run(*args, **kwargs)
+        try:
+            run = self._ff_run_getter(self)
+        except AttributeError:
+            run = None
+        if callable(run):
+            return run(*args, **kwargs)
         raise NotImplementedError(f"{self.ff_original_obj}.run doesn't exist")
 
 
@@ -1756,9 +2234,14 @@ class SequentialFunction(Function):
 
 
 class ConcurrentFunction(Function):
-    """Run functions concurrently"""
+    """Run functions concurrently
+
+    Each function runs in its own thread. Set `use_threads` to False to run them one
+    after another in the calling thread instead.
+    """
 
     funcs: list[Function] = []
+    use_threads: bool = True
 
     def __len__(self):
         return len(self.funcs)
@@ -1777,9 +2260,25 @@ class ConcurrentFunction(Function):
         return f"{self.__class__.__name__}(\n{kwargs_repr}\n)"
 
     def run(self, arg):
-        output = []
+        funcs = []
         for idx, func in enumerate(self.funcs):
             func_: Function = func() if isinstance(func, lazy) else func
-            func_ = self._prepare_child(func_, f"func{idx}_{func_.__class__.__name__}")
-            output.append(func_(arg))
-        return output
+            funcs.append(
+                self._prepare_child(func_, f"func{idx}_{func_.__class__.__name__}")
+            )
+
+        if len(funcs) < 2 or not self.use_threads:
+            return [func_(arg) for func_ in funcs]
+
+        # the tracking info is thread-local, carry it over to the worker threads
+        runstates = self.fl.runstates()
+
+        def exec(func_):
+            self.fl.track(**runstates)
+            try:
+                return func_(arg)
+            finally:
+                self.fl.clear()
+
+        with ThreadPoolExecutor(max_workers=len(funcs)) as executor:
+            return list(executor.map(exec, funcs))
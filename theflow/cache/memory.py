@@ -2,7 +2,7 @@ import logging
 import multiprocessing
 import multiprocessing.managers
 import multiprocessing.synchronize
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 from .base import BaseCache
 
@@ -17,7 +17,9 @@ class MemoryCache(BaseCache):
 
     This cache is quick to spin up and will terminate at the end of the process. It is
     suitable for testing and do small runs. It makes use of multiprocessing module to
-    allow multiple processes to share the same cache.
+    allow multiple processes to share the same cache. Each access to the shared store
+    is a round-trip to the manager process, so the operations here are written to use
+    as few accesses as possible.
 
     Args:
         uid: a unique identifier for the cache. If not provided, a fixed value "" will
@@ -40,8 +42,7 @@ class MemoryCache(BaseCache):
         if timeout is not None:
             logger.info(f"Add: Timeout value ({timeout}) is ignored for memory cache")
         with LOCKS[self.uid]:
-            if key not in MSG_STORE[self.uid]:
-                MSG_STORE[self.uid][key] = value
+            MSG_STORE[self.uid].setdefault(key, value)
 
     def get(self, key: str, default: Any = None) -> Any:
         with LOCKS[self.uid]:
@@ -49,8 +50,7 @@ class MemoryCache(BaseCache):
 
     def delete(self, key: str) -> None:
         with LOCKS[self.uid]:
-            if key in MSG_STORE[self.uid]:
-                del MSG_STORE[self.uid][key]
+            MSG_STORE[self.uid].pop(key, None)
 
     def set(self, key: str, value: Any, timeout: Optional[int] = None) -> None:
         if timeout is not None:
@@ -73,10 +73,9 @@ class MemoryCache(BaseCache):
 
     def incr(self, key: str, delta: int = 1) -> int:
         with LOCKS[self.uid]:
-            if key not in MSG_STORE[self.uid]:
-                MSG_STORE[self.uid][key] = 0
-            MSG_STORE[self.uid][key] += delta
-            return MSG_STORE[self.uid][key]
+            value = MSG_STORE[self.uid].get(key, 0) + delta
+            MSG_STORE[self.uid][key] = value
+            return value
 
     def decr(self, key: str, delta: int = 1) -> int:
         return self.incr(key, -delta)
@@ -97,6 +96,12 @@ class MemoryCache(BaseCache):
         with LOCKS[self.uid]:
             del MSG_STORE[self.uid][key]
 
+    def get_then_set(self, key: str, func: Callable[[Any], Any], default: Any = None):
+        with LOCKS[self.uid]:
+            value = func(MSG_STORE[self.uid].get(key, default))
+            MSG_STORE[self.uid][key] = value
+        return value
+
     @property
     def lock(self):
         return LOCKS[self.uid]
@@ -16,7 +16,7 @@ _aggregated_dict = {"middleware_switches"}
 class DefaultConfig:
     # skip storing the result if set to None
     store_result = "{{ theflow.callbacks.store_result__pipeline_name }}"
-    run_id = "{{ theflow.callbacks.run_id__timestamp }}"
+    run_id = "{{ theflow.callbacks.run_id__unique }}"
     function_name = "{{ theflow.callbacks.function_name__class_name }}"
 
     # middleware
@@ -26,6 +26,9 @@ class DefaultConfig:
         "theflow.middleware.SkipComponentMiddleware": True,
         "theflow.middleware.CachingMiddleware": False,
     }
+    # number of outputs kept in memory by CachingMiddleware (0 to disable). The memo
+    # isn't invalidated with the backing cache
+    memo_size = 0
 
     # params
     params_publish = False
@@ -39,21 +42,42 @@ class DefaultConfig:
 class ConfigGet:
     """A wrapper class for config retrieval"""
 
+    __slots__ = ("_config", "_pipeline")
+
     def __init__(self, config: "Config", pipeline: "Function"):
         self._config = config
         self._pipeline = pipeline
 
-    def __getattr__(self, name: str) -> Any:
+    def _lookup(self, name: str) -> Any:
+        """Get the config value, callable configs are resolved with the pipeline"""
         attr = getattr(self._config, name)
         if callable(attr):
             return attr(self._pipeline)
         return attr
 
+    def __getattr__(self, name: str) -> Any:
+        return self._lookup(name)
+
     def dump(self) -> dict:
         """Pass-through the config export"""
         return self._config.dump()
 
 
+def _config_get_property(name: str) -> property:
+    def fget(self: ConfigGet) -> Any:
+        return self._lookup(name)
+
+    return property(fget)
+
+
+# the known configs are resolved by properties, so that accessing them doesn't have to
+# fail the normal lookup first to reach `ConfigGet.__getattr__`
+for _name in DefaultConfig.__dict__:
+    if not _name.startswith("_"):
+        setattr(ConfigGet, _name, _config_get_property(_name))
+del _name
+
+
 class ConfigProperty:
     """Serve as property to access the config from the pipeline instance"""
 
@@ -106,6 +130,7 @@ class Config:
         function_name: str
         middleware_section: str
         middleware_switches: dict[str, bool]
+        memo_size: int
         params_publish: bool
         params_subscribe: bool
         allow_extra: bool
@@ -4,6 +4,14 @@ from .settings import settings
 from .utils.modules import deserialize
 
 
+class _Missing:
+    """Marker for a context that does not exist in the cache
+
+    A class rather than an `object()` instance, so that the marker survives the
+    pickling round-trip of multiprocessing-based caches.
+    """
+
+
 class Context:
     """Context to handle communication
 
@@ -32,11 +40,15 @@ class Context:
         if "__all_contexts__" not in self._cache:
             self._cache.set("__all_contexts__", [])
 
-    def _is_context_valid(self, context: Optional[str]) -> str:
+    def _is_context_valid(
+        self, context: Optional[str], check_exists: bool = True
+    ) -> str:
         """Check if the context name is valid
 
         Args:
             context: name of the context
+            check_exists: whether to check that the context exists in the cache. Skip
+                it when the caller can detect a missing context from its own access
 
         Returns:
             name of the context
@@ -49,7 +61,7 @@ class Context:
                 f"Context name must be a string or None, got {type(context)}"
             )
 
-        if context not in self._cache:
+        if check_exists and context not in self._cache:
             raise ValueError(f"Context {context} does not exist")
 
         return context
@@ -64,11 +76,32 @@ class Context:
         """
 
         def func(x):
+            if isinstance(x, _Missing):
+                raise ValueError(f"Context {context} does not exist")
             x[name] = value
             return x
 
-        context = self._is_context_valid(context)
-        self._cache.get_then_set(context, func=func, default={})
+        context = self._is_context_valid(context, check_exists=False)
+        self._cache.get_then_set(context, func=func, default=_Missing())
+
+    def update(self, values: dict, context: Optional[str] = None) -> None:
+        """Set multiple values to the context in a single cache round-trip
+
+        Args:
+            values: mapping of name to value to be set
+            context: name of the context, if None (default), use the global context
+        """
+        if not values:
+            return
+
+        def func(x):
+            if isinstance(x, _Missing):
+                raise ValueError(f"Context {context} does not exist")
+            x.update(values)
+            return x
+
+        context = self._is_context_valid(context, check_exists=False)
+        self._cache.get_then_set(context, func=func, default=_Missing())
 
     def get(
         self, name: Optional[str], default=None, context: Optional[str] = None
@@ -80,11 +113,15 @@ class Context:
             default: default value to return if the value does not exist
             context: name of the context, if None (default), use the global context
         """
-        context = self._is_context_valid(context)
+        context = self._is_context_valid(context, check_exists=False)
+        values = self._cache.get(context, _Missing())
+        if isinstance(values, _Missing):
+            raise ValueError(f"Context {context} does not exist")
+
         if name is None:
-            return self._cache[context]
+            return values
 
-        return self._cache[context].get(name, default)
+        return values.get(name, default)
 
     def clear(self, name: Optional[str], context: Optional[str]):
         """Clear a value from the context
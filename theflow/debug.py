@@ -39,7 +39,7 @@ def has_cyclic_dependency(cls: type["Function"]):
     Returns:
         True if the function has cyclic dependency, False otherwise
     """
-    params, nodes = cls._collect_registered_params_and_nodes()
+    params, nodes = cls._ff_params_names, cls._ff_nodes_names
     specs: dict[str, dict] = {}
     graph: dict[str, list[str]] = {}
 
@@ -1,12 +1,18 @@
 import logging
+import pickle
+import threading
 from abc import abstractmethod
-from typing import TYPE_CHECKING, Callable
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Tuple
 
 if TYPE_CHECKING:
     from .base import Function
 
 logger = logging.getLogger(__name__)
 
+# kwargs reserved by SkipComponentMiddleware
+_ROUTING_KWARGS = frozenset(("_ff_from", "_ff_to", "_ff_from_run"))
+
 
 class Middleware:
     """Middleware template to work on the input and output of a node"""
@@ -58,16 +64,24 @@ class SkipComponentMiddleware(Middleware):
         """
         from .runs.base import RunTracker
 
-        # Gather the from, to and from_run from the root pipeline
-        if _ff_from := kwargs.pop("_ff_from", None):
-            self.obj.context.set("from", _ff_from, context=self.obj.fl.flow_qualidx)
-        if _ff_to := kwargs.pop("_ff_to", None):
-            self.obj.context.set("to", _ff_to, context=self.obj.fl.flow_qualidx)
-        if _ff_from_run := kwargs.pop("_ff_from_run", None):
-            from_run = RunTracker(self.obj, "__from_run__")
-            from_run.load(run_path=_ff_from_run)
-
-        if _from := self.obj.context.get("from", context=self.obj.fl.flow_qualidx):
+        flow_qualidx = self.obj.fl.flow_qualidx
+
+        # Gather the from, to and from_run from the root pipeline (usually absent)
+        if routing := {
+            key: kwargs.pop(key) for key in _ROUTING_KWARGS.intersection(kwargs)
+        }:
+            if _ff_from := routing.get("_ff_from"):
+                self.obj.context.set("from", _ff_from, context=flow_qualidx)
+            if _ff_to := routing.get("_ff_to"):
+                self.obj.context.set("to", _ff_to, context=flow_qualidx)
+            if _ff_from_run := routing.get("_ff_from_run"):
+                from_run = RunTracker(self.obj, "__from_run__")
+                from_run.load(run_path=_ff_from_run)
+
+        # fetch the routing states of the flow at once
+        flow_states = self.obj.context.get(None, context=flow_qualidx)
+        _from = flow_states.get("from")
+        if _from:
             from .utils.paths import is_parent_of_child
 
             if is_parent_of_child(self.obj.fl.name, _from):
@@ -77,17 +91,18 @@ class SkipComponentMiddleware(Middleware):
         _ff_name = self.obj.fl.abs_path
 
         good_to_run: bool = True
-        if self.obj.context.has_context(context=self.obj.fl.parent_qualidx):
+        try:
             good_to_run = self.obj.context.get(
                 "good_to_run", default=True, context=self.obj.fl.parent_qualidx
             )
+        except ValueError:
+            # the parent context doesn't exist
+            pass
 
         if good_to_run is False:
             from .utils.paths import is_name_matched
 
-            if is_name_matched(
-                _ff_name, self.obj.context.get("from", context=self.obj.fl.flow_qualidx)
-            ):
+            if is_name_matched(_ff_name, _from):
                 self.obj.context.set(
                     "good_to_run", True, context=self.obj.fl.parent_qualidx
                 )
@@ -106,11 +121,8 @@ class SkipComponentMiddleware(Middleware):
                 self.obj.log_progress(_ff_name, status="run")
                 return self.next_call(*args, **kwargs)
 
-        if (
-            self.obj.context.get("to", None, context=self.obj.fl.flow_qualidx)
-            == _ff_name
-        ):
-            self.obj.context.set("good_to_run", False, context=self.obj.fl.flow_qualidx)
+        if flow_states.get("to") == _ff_name:
+            self.obj.context.set("good_to_run", False, context=flow_qualidx)
 
         self.obj.log_progress(_ff_name, status="run")
         return self.next_call(*args, **kwargs)
@@ -187,6 +199,11 @@ class TrackProgressMiddleware(Middleware):
 class CachingMiddleware(Middleware):
     """Cache the output of a function and reuse that output if the input and
     function definition is the same
+
+    The most recently used outputs can also be kept pickled in an in-process LRU
+    memo, bounded by the `memo_size` config, so that a repeated call is served
+    without a round-trip to the backing cache. The memo is not invalidated along
+    with the backing cache, so it is disabled by default.
     """
 
     def __init__(self, *args, **kwargs):
@@ -196,20 +213,72 @@ class CachingMiddleware(Middleware):
         from .utils.modules import deserialize
 
         self._cache = deserialize(settings.CACHE, safe=False)
+        self._memo: OrderedDict = OrderedDict()
+        self._memo_size: int = self.obj.config.memo_size
+        self._memo_lock = threading.Lock()
 
     def __call__(self, *args, **kwargs):
         try:
             hash_key = self.create_key(*args, **kwargs)
+            found, output = self.recall(hash_key)
+            if found:
+                return output
             if hash_key in self._cache:
-                return self._cache[hash_key]
+                output = self._cache[hash_key]
+                self.memoize(hash_key, output)
+                return output
         except Exception as e:
             logger.exception(f"Failed to create key: {e}")
             return self.next_call(*args, **kwargs)
 
         output = self.next_call(*args, **kwargs)
         self._cache[hash_key] = output
+        self.memoize(hash_key, output)
         return output
 
+    def memoize(self, key: str, value):
+        """Keep the value in the in-process memo, evicting the least recently used
+
+        The value is kept pickled, so that the caller can't modify the memoized
+        output and each hit is a new object. Unpicklable values are not memoized.
+
+        Args:
+            key: the hash key
+            value: the output to memoize
+        """
+        if self._memo_size <= 0:
+            return
+
+        try:
+            content = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return
+
+        with self._memo_lock:
+            self._memo[key] = content
+            self._memo.move_to_end(key)
+            while len(self._memo) > self._memo_size:
+                self._memo.popitem(last=False)
+
+    def recall(self, key: str) -> Tuple[bool, Any]:
+        """Get the memoized value
+
+        Args:
+            key: the hash key
+
+        Returns:
+            whether the key is memoized, and the value if it is
+        """
+        if self._memo_size <= 0:
+            return False, None
+
+        with self._memo_lock:
+            content = self._memo.get(key)
+            if content is None:
+                return False, None
+            self._memo.move_to_end(key)
+        return True, pickle.loads(content)
+
     def create_key(self, *args, **kwargs) -> str:
         """Create a key based on the input and Function's definition
 
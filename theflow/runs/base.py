@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+import math
 import pickle
 import shutil
 from pathlib import Path
@@ -7,6 +9,11 @@ from typing import TYPE_CHECKING, Any
 
 import yaml
 
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
 if TYPE_CHECKING:
     from ..base import Function
     from ..context import Context
@@ -18,6 +25,7 @@ class RunStructure:
     """The structure of a run directory"""
 
     progress = "progress.pkl"
+    progress_json = "progress.json"
     input = "input.pkl"
     output = "output.pkl"
     config = "config.yaml"
@@ -27,6 +35,88 @@ class RunStructure:
     # run_visualization = "run_visualization.dot"
 
 
+_JSON_SCALAR_TYPES = frozenset((str, bool))
+# orjson only serializes 64-bit integers
+_JSON_INT_MIN, _JSON_INT_MAX = -(2**63), 2**64 - 1
+
+
+def is_json_native(value: Any) -> bool:
+    """Check if a value round-trips through JSON without losing information
+
+    Tuples, non-string keys and non-finite floats are not JSON-native, because
+    they come back as lists, string keys and null respectively. Types are checked
+    exactly, as subclasses of the native types (e.g. `enum.IntEnum`) come back as
+    their base type. Integers beyond 64 bits are left out as orjson rejects them.
+    """
+    value_type = type(value)
+    if value is None or value_type in _JSON_SCALAR_TYPES:
+        return True
+    if value_type is int:
+        return _JSON_INT_MIN <= value <= _JSON_INT_MAX
+    if value_type is float:
+        return math.isfinite(value)
+    if value_type is list:
+        return all(is_json_native(each) for each in value)
+    if value_type is dict:
+        return all(
+            type(key) is str and is_json_native(val) for key, val in value.items()
+        )
+    return False
+
+
+def split_progress(progress: dict) -> tuple[dict, dict]:
+    """Split the progress into the JSON-native part and the rest
+
+    Each step progress is split field by field, so that cheap fields (e.g. status,
+    output) can be stored as JSON even when other fields (e.g. input args) cannot.
+
+    Args:
+        progress: the progress logs, as returned by `RunTracker.logs`
+
+    Returns:
+        the JSON-native part and the part that needs pickling
+    """
+    native: dict = {}
+    rest: dict = {}
+    for name, value in progress.items():
+        if type(value) is dict and value:
+            for key, val in value.items():
+                if is_json_native(val):
+                    native.setdefault(name, {})[key] = val
+                else:
+                    rest.setdefault(name, {})[key] = val
+        elif is_json_native(value):
+            native[name] = value
+        else:
+            rest[name] = value
+    return native, rest
+
+
+def merge_progress(native: dict, rest: dict) -> dict:
+    """Merge the parts created by `split_progress` back into the progress"""
+    progress = dict(native)
+    for name, value in rest.items():
+        if isinstance(value, dict) and isinstance(progress.get(name), dict):
+            progress[name] = {**progress[name], **value}
+        else:
+            progress[name] = value
+    return progress
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize JSON-native object, using orjson if it is installed"""
+    if orjson is None:
+        return json.dumps(obj).encode()
+    return orjson.dumps(obj)
+
+
+def loads_json(content: bytes) -> Any:
+    """Deserialize JSON content, using orjson if it is installed"""
+    if orjson is None:
+        return json.loads(content)
+    return orjson.loads(content)
+
+
 class RunManager:
     def __init__(self, dir: str):
         self.dir: Path = Path(dir)
@@ -90,8 +180,10 @@ class RunTracker:
 
         if not obj.fl.prefix:
             # root pipeline
-            self._context.set("name", obj.fl.flow_name, context=self._progress)
-            self._context.set("id", obj.fl.run_id, context=self._progress)
+            self._context.update(
+                {"name": obj.fl.flow_name, "id": obj.fl.run_id},
+                context=self._progress,
+            )
 
     def log_progress(self, name: str, **kwargs):
         """Set the input and output of the step
@@ -146,12 +238,28 @@ class RunTracker:
         return self.logs(name=name)["output"]
 
     def persist(self):
-        """Persist the run result to a store"""
-        dir = storage.join(self._obj.config.store_result, self.id())
-        with storage.open(storage.join(dir, "progress.pkl"), "wb") as fo:
-            pickle.dump(self.logs(name=None), fo)
-        with storage.open(storage.join(dir, "config.yml"), "w") as fo:
-            yaml.dump(self._config, fo)
+        """Persist the run result to a store
+
+        JSON-native values are stored in progress.json, and the rest is pickled
+        into progress.pkl. Nothing is persisted if `store_result` is not set.
+        """
+        store_result = self._obj.config.store_result
+        if not store_result:
+            return
+
+        # serialize everything first, so that a failure doesn't leave a partially
+        # written run, and each file is written in a single call
+        native, rest = split_progress(self.logs(name=None))
+        contents = {
+            RunStructure.progress_json: dumps_json(native),
+            RunStructure.progress: pickle.dumps(rest, protocol=pickle.HIGHEST_PROTOCOL),
+            "config.yml": yaml.dump(self._config).encode(),
+        }
+
+        dir = storage.join(store_result, self.id())
+        for name, content in contents.items():
+            with storage.open(storage.join(dir, name), "wb") as fo:
+                fo.write(content)
 
     def id(self) -> str:
         """Get the id of the run
@@ -168,11 +276,14 @@ class RunTracker:
             run_path: the path to the run
         """
         run_path = Path(run_path)
-        with (run_path / "progress.pkl").open("rb") as fi:
+        with (run_path / RunStructure.progress).open("rb") as fi:
             progress = pickle.load(fi)
 
-        for key, value in progress.items():
-            self._context.set(key, value, context=self._progress)
+        if (run_path / RunStructure.progress_json).exists():
+            with (run_path / RunStructure.progress_json).open("rb") as fi:
+                progress = merge_progress(loads_json(fi.read()), progress)
+
+        self._context.update(progress, context=self._progress)
 
     @property
     def config(self) -> dict | None:
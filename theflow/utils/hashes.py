@@ -1,6 +1,9 @@
 from hashlib import md5
 from typing import Any
 
+# type marker of str, used to hash the structural markers of containers
+_STR_MARKER = f"{chr(0)}{str}{chr(0)}"
+
 
 class naivehash:
     """Hash a Python object
@@ -26,34 +29,38 @@ class naivehash:
         if isinstance(obj, (str, int, float, bool)) or obj is None:
             self.hash_func.update(f"|{type_}|{obj}".encode())
         elif isinstance(obj, (tuple, list)):
-            self.update(f"|{type_}|")
+            self._update_str(f"|{type_}|")
             for idx, item in enumerate(obj):
-                self.update(f"|{type_}{idx}|")
+                self._update_str(f"|{type_}{idx}|")
                 self.update(item)
         elif isinstance(obj, set):
-            self.update(f"|{type_}|")
+            self._update_str(f"|{type_}|")
             for idx, item in enumerate(sorted(obj)):
-                self.update(f"|{type_}{idx}|")
+                self._update_str(f"|{type_}{idx}|")
                 self.update(item)
         elif isinstance(obj, dict):
-            self.update(f"|{type_}|")
+            self._update_str(f"|{type_}|")
             for idx, key in enumerate(sorted(obj)):
-                self.update(f"|{type_}{idx}|")
+                self._update_str(f"|{type_}{idx}|")
                 self.update(key)
                 self.update(obj[key])
         else:
             path = ""
             path += str(obj.__module__) if hasattr(obj, "__module__") else ""
             path += str(obj.__name__) if hasattr(obj, "__name__") else ""
-            self.update(f"|{type_}|{path}|")
+            self._update_str(f"|{type_}|{path}|")
 
             for idx, attr in enumerate(sorted(dir(obj))):
                 if attr.startswith("_"):
                     continue
-                self.update(f"|{type_}{idx}|")
-                self.update(attr)
+                self._update_str(f"|{type_}{idx}|")
+                self._update_str(attr)
                 # avoid self.update(getattr(obj, attr)) to avoid infinite recursion
-                self.update(str(getattr(obj, attr)))
+                self._update_str(str(getattr(obj, attr)))
+
+    def _update_str(self, value: str):
+        """Hash a str, same as `update(value)` but without the type dispatch"""
+        self.hash_func.update(f"|{_STR_MARKER}|{value}".encode())
 
     def __call__(self, obj: Any) -> str:
         """Return the hash digest"""
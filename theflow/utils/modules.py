@@ -7,6 +7,8 @@ from typing import Any, Dict, Generic, Optional, Type, TypeVar
 
 logger = logging.getLogger(__name__)
 NATIVE_TYPE = (dict, list, tuple, str, int, float, bool, type(None))
+# exact types that can skip the isinstance checks in serialize and deserialize
+_SCALAR_TYPES = frozenset((int, float, bool, type(None)))
 
 
 def import_dotted_string(
@@ -98,6 +100,15 @@ def import_modules(*module_names: str) -> tuple:
 
 def serialize(value: Any) -> Any:
     """Serialize a value to a JSON-serializable object"""
+    # fast path for the common exact types
+    type_ = type(value)
+    if type_ is str or type_ in _SCALAR_TYPES:
+        return value
+    if type_ is dict:
+        return {key: serialize(val) for key, val in value.items()}
+    if type_ is list:
+        return [serialize(val) for val in value]
+
     if isinstance(value, dict):
         return {key: serialize(val) for key, val in value.items()}
 
@@ -151,6 +162,11 @@ def deserialize(
         safe: if True, only allowed modules can be imported
         allowed_modules: dict of allowed modules
     """
+    # fast path for the common exact types
+    type_ = type(value)
+    if type_ in _SCALAR_TYPES or (type_ is str and not value.startswith("{{")):
+        return value
+
     if isinstance(value, str) and value.startswith("{{") and value.endswith("}}"):
         return import_dotted_string(
             value[2:-2].strip(), safe=safe, allowed_modules=allowed_modules
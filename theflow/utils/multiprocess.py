@@ -1,10 +1,39 @@
+import atexit
 import multiprocessing
 import multiprocessing.managers
-from typing import TYPE_CHECKING, Dict, List, cast
+import os
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, cast
 
 if TYPE_CHECKING:
     from ..base import Function
 
+# (pid, manager) of the manager shared by all `parallel` calls in this process
+_manager: Optional[Tuple[int, multiprocessing.managers.SyncManager]] = None
+_manager_lock = threading.Lock()
+
+
+def _get_manager() -> multiprocessing.managers.SyncManager:
+    """Get the manager shared by all `parallel` calls, start it if necessary
+
+    Starting a manager spawns a server process, so it is started once per process
+    and shut down when the interpreter exits.
+    """
+    global _manager
+    with _manager_lock:
+        if _manager is None or _manager[0] != os.getpid():
+            manager = multiprocessing.Manager()
+            _manager = (os.getpid(), manager)
+            atexit.register(_shutdown_manager, manager)
+        return _manager[1]
+
+
+def _shutdown_manager(manager: multiprocessing.managers.SyncManager):
+    global _manager
+    if _manager is not None and _manager[1] is manager:
+        _manager = None
+    manager.shutdown()
+
 
 def _run_node(task):
     obj: "Function" = task[0]
@@ -29,17 +58,15 @@ def parallel(obj: "Function", child_name: str, tasks: List[Dict], **kwargs):
         tasks (List[Dict]): List of parameters for each task
         kwargs: Keyword arguments for multiprocessing.Pool
     """
-    manager = None
+    state = obj._ff_state
     try:
-        manager = multiprocessing.Manager()
-        obj._ff_childs_called = cast("dict", manager.dict(obj._ff_childs_called))
+        manager = _get_manager()
+        state.childs_called = cast("dict", manager.dict(state.childs_called or {}))
         lock = manager.Lock()
 
         tasks_mp = [(obj, child_name, task, lock) for task in tasks]
         with multiprocessing.Pool(**kwargs) as pool:
             yield from pool.imap(_run_node, tasks_mp)
     finally:
-        if isinstance(obj._ff_childs_called, multiprocessing.managers.DictProxy):
-            obj._ff_childs_called = obj._ff_childs_called.copy()
-        if manager is not None:
-            manager.shutdown()
+        if isinstance(state.childs_called, multiprocessing.managers.DictProxy):
+            state.childs_called = state.childs_called.copy()
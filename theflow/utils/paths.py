@@ -1,4 +1,5 @@
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Union
 
@@ -114,9 +115,14 @@ def is_name_matched(name: str, pattern: str) -> bool:
     Returns:
         True if the name matches the pattern, False otherwise
     """
+    return _compile_pattern(pattern).match(name) is not None
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile the wildcard pattern used by `is_name_matched` into a regex"""
     pattern_parts: List[str] = [re.escape(part) for part in pattern.split("*")]
-    regex_pattern: str = r"^" + r"[^.]+".join(pattern_parts) + r"$"
-    return re.findall(regex_pattern, name) != []
+    return re.compile(r"^" + r"[^.]+".join(pattern_parts) + r"$")
 
 
 def is_parent_of_child(parent: str, child: str) -> bool:
@@ -5,6 +5,7 @@ Consider these as experimental due to very naive implementation that for sure ca
 handle uncommon cases.
 """
 import inspect
+from functools import lru_cache
 from typing import _GenericAlias  # type: ignore
 from typing import Any, Callable, Union, get_args, get_origin
 
@@ -57,6 +58,34 @@ def is_compatible_with(type1, type2) -> bool:
     return False
 
 
+@lru_cache(maxsize=1024)
+def _cached_signature(func: Callable) -> inspect.Signature:
+    return inspect.signature(func)
+
+
+def _signature(func: Callable) -> inspect.Signature:
+    """Get the signature of func, memoized on the underlying function
+
+    Bound methods are resolved through their `__func__` so that the cache doesn't keep
+    the instances alive.
+    """
+    if inspect.ismethod(func):
+        sig = _signature(func.__func__)
+        params = tuple(sig.parameters.values())
+        # the bound object fills the first positional parameter, `*args` absorbs it
+        if params and params[0].kind in (
+            inspect.Parameter.POSITIONAL_ONLY,
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+        ):
+            params = params[1:]
+        return sig.replace(parameters=params)
+    try:
+        return _cached_signature(func)
+    except TypeError:
+        # unhashable callable
+        return inspect.signature(func)
+
+
 def input_signature(
     func: Callable, ignore_bound: bool = True
 ) -> tuple[dict, bool, bool]:
@@ -71,7 +100,7 @@ def input_signature(
         - a bool indicating if the function has *args
         - a bool indicating if the function has **kwargs
     """
-    args = inspect.signature(func).parameters
+    args = _signature(func).parameters
     type_annotation = {}
     bounds = {"self", "cls"}
     has_args, has_kwargs = False, False
@@ -104,7 +133,7 @@ def output_signature(func: Callable) -> Any:
     Returns:
         the return type annotation
     """
-    annot = inspect.signature(func).return_annotation
+    annot = _signature(func).return_annotation
     if annot is inspect.Signature.empty:
         annot = Any
     return annot
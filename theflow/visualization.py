@@ -3,6 +3,7 @@ from __future__ import annotations
 import ast
 import inspect
 from collections import defaultdict
+from functools import lru_cache
 
 IGNORE = (
     ast.Call,
@@ -32,13 +33,19 @@ def trace_pipelne_run(cls) -> list:
     Returns:
         list: the logic flow of the pipeline run (suitable for dot)
     """
-    tree = ast.parse(inspect.getsource(cls))
+    tree = _parse_source(cls)
     analyzer = PipelineRunTracer()
     analyzer.visit(tree)
 
     return analyzer.logic_flow
 
 
+@lru_cache(maxsize=128)
+def _parse_source(cls) -> ast.Module:
+    """Parse the source of a class once, the tracer only reads the tree"""
+    return ast.parse(inspect.getsource(cls))
+
+
 def get_ast_node_name(node) -> str:
     """Get human-readable name of an ast node
 